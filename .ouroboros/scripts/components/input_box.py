@@ -7,6 +7,7 @@ support, scrolling, badge rendering, and status bar.
 
 """
 
+import os
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -25,6 +26,33 @@ from utils.badge import (
 from utils.text import visible_len, char_width, wrap_text
 from components.status_bar import StatusBar
 
+# Length of the paste marker opener "‹PASTE:" that precedes the line count
+_PASTE_COUNT_START = len("‹PASTE:")
+
+
+def _badge_text(marker_text: str, marker_type: str) -> str:
+    """
+    Badge shown for a marker, used to measure cursor columns.
+
+    - «path» -> [ filename ]
+    - ‹PASTE:N›content‹/PASTE› -> [ Pasted N Lines ]
+    """
+    if marker_type == "file":
+        path = marker_text[1:-1]  # Remove « and »
+        filename = os.path.basename(path) or path.rpartition("/")[2] or path
+        return f"[ {filename} ]"
+    if marker_type == "paste":
+        # Read the count by slicing up to the closing ›; no regex needed
+        end = marker_text.find("›")
+        digits = marker_text[_PASTE_COUNT_START:end]
+        if end == -1 or not digits.isdecimal():
+            return "[ Pasted ]"
+        line_count = int(digits)
+        if line_count == 1:
+            return "[ Pasted 1 Line ]"
+        return f"[ Pasted {line_count} Lines ]"
+    return marker_text
+
 
 class InputBox:
     """
@@ -205,9 +233,6 @@ class InputBox:
         Returns:
             Display column position
         """
-        import re
-        import os
-
         # Find all markers (both file path and paste markers)
         markers = find_markers(line)
 
@@ -235,48 +260,14 @@ class InputBox:
             # Check if cursor is inside the marker
             if cursor_col <= end:
                 # Cursor is at or inside marker - calculate badge width
-                marker_text = line[start:end]
-                if marker_type == "file":
-                    # File marker: «path» -> [ filename ]
-                    path = marker_text[1:-1]  # Remove « and »
-                    filename = os.path.basename(path) or path.split("/")[-1] or path
-                    badge_text = f"[ {filename} ]"
-                elif marker_type == "paste":
-                    # Paste marker: ‹PASTE:N›content‹/PASTE› -> [ Pasted N Lines ]
-                    match = re.match(r"‹PASTE:(\d+)›", marker_text)
-                    if match:
-                        line_count = int(match.group(1))
-                        if line_count == 1:
-                            badge_text = "[ Pasted 1 Line ]"
-                        else:
-                            badge_text = f"[ Pasted {line_count} Lines ]"
-                    else:
-                        badge_text = "[ Pasted ]"
-                else:
-                    badge_text = marker_text
+                badge_text = _badge_text(line[start:end], marker_type)
 
                 # Cursor at or inside badge - put it at end of badge
                 display_col += visible_len(badge_text)
                 return display_col
 
             # Cursor is after this marker - add badge width
-            marker_text = line[start:end]
-            if marker_type == "file":
-                path = marker_text[1:-1]
-                filename = os.path.basename(path) or path.split("/")[-1] or path
-                badge_text = f"[ {filename} ]"
-            elif marker_type == "paste":
-                match = re.match(r"‹PASTE:(\d+)›", marker_text)
-                if match:
-                    line_count = int(match.group(1))
-                    if line_count == 1:
-                        badge_text = "[ Pasted 1 Line ]"
-                    else:
-                        badge_text = f"[ Pasted {line_count} Lines ]"
-                else:
-                    badge_text = "[ Pasted ]"
-            else:
-                badge_text = marker_text
+            badge_text = _badge_text(line[start:end], marker_type)
 
             display_col += visible_len(badge_text)
             last_end = end
@@ -568,7 +559,6 @@ class InputBox:
         # Draw prompt header in top border
         # Format: ╭──◎ INPUT──────────────────╮ or ╭──◇ Custom Header──────╮
         prompt_attr = self.theme.get_attr("prompt") if self.theme else 0
-        import os
 
         def _truncate_to_display_width(text: str, max_width: int) -> str:
             if max_width <= 0:
@@ -660,7 +650,7 @@ class InputBox:
         self.update_scroll()
 
         # Get visible lines
-        visible_lines = self.buffer.get_visible_lines(self._height)
+        visible_lines = self.buffer.iter_visible_lines(self._height)
         content_width = self._get_content_width()
 
         # Build visual lines with wrapping
@@ -843,6 +833,8 @@ class InputBox:
         # Flush all at once
         sys.stderr.write("".join(output))
         sys.stderr.flush()
+        # Drawn outside the window, so the row cache no longer matches
+        self.screen.invalidate_rows()
 
         # Position cursor at correct location
         self._position_cursor()
@@ -931,6 +923,8 @@ class InputBox:
         # Flush all at once
         sys.stderr.write("".join(output))
         sys.stderr.flush()
+        # Deleting lines shifts every row below, so repaint them all next time
+        self.screen.invalidate_rows()
 
     def handle_resize(self, new_width: int, new_height: int = None) -> None:
         """
@@ -17,6 +17,10 @@ if TYPE_CHECKING:
     from ..tui.theme import ThemeManager
     from ..tui.window import Window
 
+# Compiled once for prompt and option parsing
+_YES_NO_RE = re.compile(r"\[y/n\]", re.IGNORECASE)
+_NUMBERED_OPTION_RE = re.compile(r"^\s*(\d+)[.)\]]\s*(.+)$")
+
 
 class SelectionMenu:
     """
@@ -123,7 +127,7 @@ class SelectionMenu:
         Returns:
             True if prompt contains [y/n] pattern
         """
-        return bool(re.search(r"\[y/n\]", prompt, re.IGNORECASE))
+        return _YES_NO_RE.search(prompt) is not None
 
     @staticmethod
     def parse_numbered_options(text: str) -> List[str]:
@@ -141,10 +145,10 @@ class SelectionMenu:
             List of parsed options
         """
         options = []
-        pattern = r"^\s*(\d+)[.)\]]\s*(.+)$"
+        match_option = _NUMBERED_OPTION_RE.match
 
         for line in text.split("\n"):
-            match = re.match(pattern, line.strip())
+            match = match_option(line.strip())
             if match:
                 options.append(match.group(2).strip())
 
@@ -303,7 +307,7 @@ class SelectionMenu:
             'y' for Yes, 'n' for No
         """
         _, value, _ = self.get_selected()
-        if value.lower().startswith("y"):
+        if value[:1].lower() == "y":
             return "y"
         return "n"
 
@@ -7,41 +7,141 @@ scrolling, and word navigation.
 
 """
 
+import re
+from itertools import islice
+from typing import Iterator
+
+# Rest of the current word followed by the blanks after it
+_WORD_RIGHT_RE = re.compile(r"[^ \t]*[ \t]*")
+
+
+class _Lines(list):
+    """
+    List of buffer lines that counts in-place mutations.
+
+    Callers outside TextBuffer edit ``buffer.lines`` directly, so the cached
+    text is validated against this counter rather than a flag that only the
+    TextBuffer methods would know to set.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+    def __setitem__(self, index, value):
+        self.version += 1
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self.version += 1
+        super().__delitem__(index)
+
+    def __iadd__(self, other):
+        self.version += 1
+        return super().__iadd__(other)
+
+    def __imul__(self, count):
+        self.version += 1
+        return super().__imul__(count)
+
+    def append(self, value):
+        self.version += 1
+        super().append(value)
+
+    def extend(self, values):
+        self.version += 1
+        super().extend(values)
+
+    def insert(self, index, value):
+        self.version += 1
+        super().insert(index, value)
+
+    def pop(self, index=-1):
+        self.version += 1
+        return super().pop(index)
+
+    def remove(self, value):
+        self.version += 1
+        super().remove(value)
+
+    def clear(self):
+        self.version += 1
+        super().clear()
+
+    def sort(self, *args, **kwargs):
+        self.version += 1
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self.version += 1
+        super().reverse()
+
 
 class TextBuffer:
     """Multi-line text buffer with cursor management."""
 
     def __init__(self):
-        self.lines = [""]
+        self._lines = _Lines([""])
         self.cursor_row = 0
         self.cursor_col = 0
         self.scroll_offset = 0  # For viewport scrolling
+        self._text_cache = ""
+        self._text_version = -1
+
+    @property
+    def lines(self) -> list:
+        """Buffer lines; may be edited in place."""
+        return self._lines
+
+    @lines.setter
+    def lines(self, value: list) -> None:
+        self._lines = _Lines(value)
+        self._text_version = -1
 
     @property
     def text(self) -> str:
         """Get full text content with newlines."""
-        return "\n".join(self.lines)
+        lines = self._lines
+        if lines.version != self._text_version:
+            self._text_cache = "\n".join(lines)
+            self._text_version = lines.version
+        return self._text_cache
+
+    def ends_with(self, suffix: str) -> bool:
+        """
+        Check whether the full text ends with suffix.
+
+        A suffix without newlines can only end the last line, so it is
+        checked there instead of joining every line into ``text``.
+        """
+        lines = self._lines
+        if "\n" in suffix or not lines:
+            return self.text.endswith(suffix)
+        return lines[-1].endswith(suffix)
 
     @property
     def line_count(self) -> int:
         """Get number of lines in buffer."""
-        return len(self.lines)
+        return len(self._lines)
 
     def insert_char(self, char: str) -> None:
         """Insert a single character at cursor position."""
-        line = self.lines[self.cursor_row]
-        self.lines[self.cursor_row] = (
-            line[: self.cursor_col] + char + line[self.cursor_col :]
-        )
+        line = self._lines[self.cursor_row]
+        col = self.cursor_col
+        if col >= len(line):
+            # Typing at end of line: one copy instead of two slices and a join
+            self._lines[self.cursor_row] = line + char
+        else:
+            self._lines[self.cursor_row] = line[:col] + char + line[col:]
         self.cursor_col += 1
 
     def insert_text(self, text: str) -> None:
         """Insert multi-character text (e.g., paste)."""
-        for char in text:
-            if char == "\n":
-                self.newline()
-            elif char != "\r":
-                self.insert_char(char)
+        if "\r" in text:
+            text = text.replace("\r", "")
+        self._splice_lines(text.split("\n"))
 
     def insert_formatted_paste(self, text: str) -> None:
         """Insert text with formatting preserved (for Ctrl+Shift+Enter paste)."""
@@ -49,17 +149,36 @@ class TextBuffer:
         text = text.replace("\r\n", "\n").replace("\r", "\n")
         # Strip trailing whitespace from each line but preserve structure
         lines = [line.rstrip() for line in text.split("\n")]
-        # Remove empty lines at start/end
-        while lines and not lines[0]:
-            lines.pop(0)
-        while lines and not lines[-1]:
-            lines.pop()
-        # Insert
-        for i, line in enumerate(lines):
-            if i > 0:
-                self.newline()
-            for char in line:
-                self.insert_char(char)
+        # Remove empty lines at start/end with one slice rather than
+        # popping from the front of the list line by line
+        start = next((i for i, line in enumerate(lines) if line), len(lines))
+        end = len(lines)
+        while end > start and not lines[end - 1]:
+            end -= 1
+        if start < end:
+            self._splice_lines(lines[start:end])
+
+    def _splice_lines(self, parts: list) -> None:
+        """
+        Insert pre-split lines at the cursor in one list splice.
+
+        Only the cursor line is rebuilt: its head takes the first part and
+        its tail is appended to the last, so the cost is linear in the
+        inserted text rather than one line copy per character.
+        """
+        row = self.cursor_row
+        line = self._lines[row]
+        head = line[: self.cursor_col]
+        tail = line[self.cursor_col :]
+        if len(parts) == 1:
+            self._lines[row] = head + parts[0] + tail
+            self.cursor_col += len(parts[0])
+            return
+        last = parts[-1]
+        self._lines[row] = head + parts[0]
+        self._lines[row + 1 : row + 1] = parts[1:-1] + [last + tail]
+        self.cursor_row = row + len(parts) - 1
+        self.cursor_col = len(last)
 
     def newline(self) -> None:
         """
@@ -71,10 +190,10 @@ class TextBuffer:
         - WHEN Enter is pressed in middle of line, split the line at cursor position
         - WHEN Enter is pressed, move cursor to the beginning of the new line
         """
-        line = self.lines[self.cursor_row]
-        # Split line at cursor position
-        self.lines[self.cursor_row] = line[: self.cursor_col]
-        self.lines.insert(self.cursor_row + 1, line[self.cursor_col :])
+        row = self.cursor_row
+        line = self._lines[row]
+        # Split line at cursor position in one splice
+        self._lines[row : row + 1] = [line[: self.cursor_col], line[self.cursor_col :]]
         # Move cursor to beginning of new line
         self.cursor_row += 1
         self.cursor_col = 0
@@ -86,18 +205,19 @@ class TextBuffer:
         Returns True if deletion occurred, False otherwise.
         """
         if self.cursor_col > 0:
-            line = self.lines[self.cursor_row]
-            self.lines[self.cursor_row] = (
-                line[: self.cursor_col - 1] + line[self.cursor_col :]
-            )
+            line = self._lines[self.cursor_row]
+            col = self.cursor_col
+            if col >= len(line):
+                self._lines[self.cursor_row] = line[: col - 1]
+            else:
+                self._lines[self.cursor_row] = line[: col - 1] + line[col:]
             self.cursor_col -= 1
             return True
         elif self.cursor_row > 0:
             # Merge with previous line
-            prev_line = self.lines[self.cursor_row - 1]
-            curr_line = self.lines[self.cursor_row]
-            self.lines[self.cursor_row - 1] = prev_line + curr_line
-            del self.lines[self.cursor_row]
+            row = self.cursor_row
+            prev_line = self._lines[row - 1]
+            self._lines[row - 1 : row + 1] = [prev_line + self._lines[row]]
             self.cursor_row -= 1
             self.cursor_col = len(prev_line)
             return True
@@ -109,17 +229,16 @@ class TextBuffer:
 
         Returns True if deletion occurred, False otherwise.
         """
-        line = self.lines[self.cursor_row]
+        line = self._lines[self.cursor_row]
         if self.cursor_col < len(line):
-            self.lines[self.cursor_row] = (
+            self._lines[self.cursor_row] = (
                 line[: self.cursor_col] + line[self.cursor_col + 1 :]
             )
             return True
-        elif self.cursor_row < len(self.lines) - 1:
+        elif self.cursor_row < len(self._lines) - 1:
             # Merge with next line
-            next_line = self.lines[self.cursor_row + 1]
-            self.lines[self.cursor_row] = line + next_line
-            del self.lines[self.cursor_row + 1]
+            row = self.cursor_row
+            self._lines[row : row + 2] = [line + self._lines[row + 1]]
             return True
         return False
 
@@ -130,17 +249,17 @@ class TextBuffer:
             return True
         elif self.cursor_row > 0:
             self.cursor_row -= 1
-            self.cursor_col = len(self.lines[self.cursor_row])
+            self.cursor_col = len(self._lines[self.cursor_row])
             return True
         return False
 
     def move_right(self) -> bool:
         """Move cursor right, wrapping to next line if needed."""
-        line = self.lines[self.cursor_row]
+        line = self._lines[self.cursor_row]
         if self.cursor_col < len(line):
             self.cursor_col += 1
             return True
-        elif self.cursor_row < len(self.lines) - 1:
+        elif self.cursor_row < len(self._lines) - 1:
             self.cursor_row += 1
             self.cursor_col = 0
             return True
@@ -150,15 +269,15 @@ class TextBuffer:
         """Move cursor up one line."""
         if self.cursor_row > 0:
             self.cursor_row -= 1
-            self.cursor_col = min(self.cursor_col, len(self.lines[self.cursor_row]))
+            self.cursor_col = min(self.cursor_col, len(self._lines[self.cursor_row]))
             return True
         return False
 
     def move_down(self) -> bool:
         """Move cursor down one line."""
-        if self.cursor_row < len(self.lines) - 1:
+        if self.cursor_row < len(self._lines) - 1:
             self.cursor_row += 1
-            self.cursor_col = min(self.cursor_col, len(self.lines[self.cursor_row]))
+            self.cursor_col = min(self.cursor_col, len(self._lines[self.cursor_row]))
             return True
         return False
 
@@ -168,7 +287,7 @@ class TextBuffer:
 
     def end(self) -> None:
         """Move cursor to end of current line."""
-        self.cursor_col = len(self.lines[self.cursor_row])
+        self.cursor_col = len(self._lines[self.cursor_row])
 
     def clear(self) -> None:
         """Clear all buffer content."""
@@ -179,12 +298,12 @@ class TextBuffer:
 
     def clear_line(self) -> None:
         """Clear current line."""
-        self.lines[self.cursor_row] = ""
+        self._lines[self.cursor_row] = ""
         self.cursor_col = 0
 
-    def get_visible_lines(self, viewport_height: int) -> list:
+    def iter_visible_lines(self, viewport_height: int) -> Iterator[str]:
         """
-        Get lines visible in viewport with scrolling.
+        Iterate lines visible in viewport with scrolling, without copying.
 
         Adjusts scroll offset to keep cursor visible.
         """
@@ -194,10 +313,16 @@ class TextBuffer:
         elif self.cursor_row >= self.scroll_offset + viewport_height:
             self.scroll_offset = self.cursor_row - viewport_height + 1
 
-        # Return visible lines
         start = self.scroll_offset
-        end = min(start + viewport_height, len(self.lines))
-        return self.lines[start:end]
+        return islice(self._lines, start, start + viewport_height)
+
+    def get_visible_lines(self, viewport_height: int) -> list:
+        """
+        Get lines visible in viewport with scrolling.
+
+        Adjusts scroll offset to keep cursor visible.
+        """
+        return list(self.iter_visible_lines(viewport_height))
 
     def get_visible_cursor_row(self) -> int:
         """Get cursor row relative to viewport."""
@@ -205,25 +330,12 @@ class TextBuffer:
 
     def word_left(self) -> None:
         """Move cursor to the start of the previous word."""
-        line = self.lines[self.cursor_row]
-        col = self.cursor_col
-        # Skip spaces going left
-        while col > 0 and (col > len(line) or line[col - 1] in " \t"):
-            col -= 1
-        # Skip word characters going left
-        while col > 0 and col <= len(line) and line[col - 1] not in " \t":
-            col -= 1
-        self.cursor_col = col
+        # Drop trailing blanks, then land just past the last blank before it
+        head = self._lines[self.cursor_row][: self.cursor_col].rstrip(" \t")
+        self.cursor_col = max(head.rfind(" "), head.rfind("\t")) + 1
 
     def word_right(self) -> None:
         """Move cursor to the start of the next word."""
-        line = self.lines[self.cursor_row]
-        col = self.cursor_col
-        line_len = len(line)
-        # Skip word characters going right
-        while col < line_len and line[col] not in " \t":
-            col += 1
-        # Skip spaces going right
-        while col < line_len and line[col] in " \t":
-            col += 1
-        self.cursor_col = col
+        line = self._lines[self.cursor_row]
+        if self.cursor_col < len(line):
+            self.cursor_col = _WORD_RIGHT_RE.match(line, self.cursor_col).end()
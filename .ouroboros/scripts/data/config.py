@@ -9,12 +9,19 @@ This module provides configuration management with JSON persistence.
 import os
 import sys
 import json
-from typing import Any, Optional
+import atexit
+import tempfile
+import threading
+import weakref
+from typing import Any, Dict, Optional
 
 # Default config file path
 SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DEFAULT_CONFIG_FILE = os.path.join(SCRIPT_DIR, "ouroboros.config.json")
 
+# Seconds to wait after set() before writing, so bursts share one save
+SAVE_DELAY = 0.5
+
 # Default configuration values
 DEFAULT_CONFIG = {
     "platform": "windows" if sys.platform == "win32" else "unix",
@@ -43,6 +50,10 @@ class ConfigManager:
 
     """
 
+    # Live managers, flushed by one process-wide atexit hook
+    _instances: "weakref.WeakSet[ConfigManager]" = weakref.WeakSet()
+    _atexit_registered = False
+
     def __init__(self, config_file: str = None):
         """
         Initialize ConfigManager.
@@ -52,7 +63,16 @@ class ConfigManager:
         """
         self.config_file = config_file or DEFAULT_CONFIG_FILE
         self.config = dict(DEFAULT_CONFIG)
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        # Held for a whole flush, so an atexit flush waits for a save the
+        # timer thread has in flight
+        self._save_lock = threading.RLock()
         self._load()
+        ConfigManager._instances.add(self)
+        if not ConfigManager._atexit_registered:
+            atexit.register(ConfigManager._flush_all)
+            ConfigManager._atexit_registered = True
 
     def _load(self) -> None:
         """
@@ -61,24 +81,83 @@ class ConfigManager:
         Handles corrupted config file gracefully by using defaults.
         """
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    loaded = json.load(f)
-                    self.config.update(loaded)
-            else:
-                # Create default config file
-                self._save()
+            # Open directly rather than checking existence first: one
+            # syscall instead of two
+            with open(self.config_file, "r", encoding="utf-8") as f:
+                loaded = json.load(f)
+                self.config.update(loaded)
+        except FileNotFoundError:
+            # Create default config file
+            self._save()
         except (IOError, OSError, json.JSONDecodeError, UnicodeDecodeError):
             # Handle corrupted file gracefully - use defaults
             self.config = dict(DEFAULT_CONFIG)
 
     def _save(self) -> None:
-        """Save config to file."""
+        """
+        Save config to file.
+
+        The config is written to a temporary file in the same directory and
+        moved over the old one, so an interrupted save never leaves an empty
+        or partial config.
+        """
+        tmp_path = None
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=2)
+            with self._save_lock:
+                # Serialize first so the file gets one write instead of one
+                # per JSON token that json.dump would emit
+                data = json.dumps(dict(self.config), indent=2).encode("utf-8")
+                directory = os.path.dirname(os.path.abspath(self.config_file))
+                fd, tmp_path = tempfile.mkstemp(
+                    prefix=".ouroboros-config-", dir=directory
+                )
+                with open(fd, "wb") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                try:
+                    # mkstemp creates 0600; keep the existing file's permissions
+                    os.chmod(tmp_path, os.stat(self.config_file).st_mode & 0o777)
+                except OSError:
+                    pass
+                os.replace(tmp_path, self.config_file)
+                tmp_path = None
         except (IOError, OSError):
             pass  # Silently fail on save errors
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _schedule_save(self) -> None:
+        """Mark config dirty and (re)start the debounced save timer."""
+        self._dirty = True
+        timer = self._save_timer
+        if timer is not None:
+            timer.cancel()
+        timer = threading.Timer(SAVE_DELAY, self.flush)
+        timer.daemon = True
+        self._save_timer = timer
+        timer.start()
+
+    def flush(self) -> None:
+        """Write pending changes now instead of waiting for the timer."""
+        timer = self._save_timer
+        self._save_timer = None
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+        with self._save_lock:
+            if self._dirty:
+                self._dirty = False
+                self._save()
+
+    @classmethod
+    def _flush_all(cls) -> None:
+        """Cleanup handler for atexit, covering every live manager."""
+        for manager in list(cls._instances):
+            manager.flush()
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -97,17 +176,39 @@ class ConfigManager:
         """
         Set config value and save.
 
+        Unchanged values are not written; changes are saved after SAVE_DELAY
+        so a burst of sets costs one write.
+
         Args:
             key: Configuration key
             value: Value to set
         """
+        if key in self.config and self.config[key] == value:
+            return
         self.config[key] = value
-        self._save()
+        self._schedule_save()
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """
+        Set several config values and save them with a single write.
+
+        Args:
+            values: Mapping of configuration keys to values
+        """
+        changed = False
+        for key, value in values.items():
+            if key not in self.config or self.config[key] != value:
+                self.config[key] = value
+                changed = True
+        if changed:
+            self._dirty = True
+            self.flush()
 
     def reset(self) -> None:
         """Reset configuration to defaults."""
         self.config = dict(DEFAULT_CONFIG)
-        self._save()
+        self._dirty = True
+        self.flush()
 
     @property
     def platform(self) -> str:
@@ -152,14 +253,19 @@ class ConfigManager:
 
 # Global config instance
 _config: Optional[ConfigManager] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> ConfigManager:
-    """Get or create global config manager."""
+    """Get or create global config manager (safe to call from any thread)."""
     global _config
-    if _config is None:
-        _config = ConfigManager()
-    return _config
+    config = _config
+    if config is None:
+        with _config_lock:
+            config = _config
+            if config is None:
+                config = _config = ConfigManager()
+    return config
 
 
 def reset_global_config() -> None:
@@ -7,13 +7,49 @@ and search functionality.
 
 """
 
+import io
 import os
-from typing import List, Optional
+import re
+import time
+import queue
+import atexit
+import tempfile
+import threading
+import weakref
+from collections import deque
+from typing import BinaryIO, Dict, List, Optional, TextIO, Tuple
 
 # Default history file path
 SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DEFAULT_HISTORY_FILE = os.path.join(SCRIPT_DIR, "ouroboros.history")
 
+# Lines the file may hold beyond max_entries before it is rewritten
+# (compacted) down to max_entries: at least COMPACT_SLACK, and at least
+# max_entries // COMPACT_DIVISOR so every rewrite of N lines is paid for by
+# N / COMPACT_DIVISOR one-line appends however large the history is
+COMPACT_SLACK = 256
+COMPACT_DIVISOR = 4
+
+# Buffer for compaction rewrites, large enough for a full history in one write
+WRITE_BUFFER_SIZE = 512 * 1024
+
+# How long the writer thread waits to coalesce entries into one write
+COALESCE_WINDOW = 0.1
+
+# Files larger than this are loaded from the end, reading backwards in
+# blocks only until max_entries lines are found
+TAIL_READ_THRESHOLD = 128 * 1024
+TAIL_READ_BLOCK = 64 * 1024
+
+# Escapes written by HistoryManager._escape: backslash-n for a newline and a
+# doubled backslash for a backslash
+_ESCAPE_RE = re.compile(r"\\([n\\])")
+
+
+def _unescape_match(match: "re.Match[str]") -> str:
+    """Replacement for one _ESCAPE_RE match."""
+    return "\n" if match.group(1) == "n" else "\\"
+
 
 class HistoryManager:
     """
@@ -30,6 +66,10 @@ class HistoryManager:
 
     """
 
+    # Live managers, flushed by one process-wide atexit hook
+    _instances: "weakref.WeakSet[HistoryManager]" = weakref.WeakSet()
+    _atexit_registered = False
+
     def __init__(self, history_file: str = None, max_entries: int = 1000):
         """
         Initialize HistoryManager.
@@ -43,7 +83,19 @@ class HistoryManager:
         self.entries: List[str] = []
         self.position = 0  # Current position in history (0 = oldest)
         self._temp_current = ""  # Temp storage for current input when browsing
+        self._file: Optional[BinaryIO] = None  # Append handle, opened lazily
+        self._file_lines = 0  # Entry lines in the file, read or appended
+        # Disk writes run on a background thread, started on first add
+        self._write_queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        # Lowercased entries for search, keyed by the entry itself so direct
+        # edits to self.entries can never leave it stale
+        self._fold_cache: Dict[str, str] = {}
         self._load()
+        HistoryManager._instances.add(self)
+        if not HistoryManager._atexit_registered:
+            atexit.register(HistoryManager._flush_all)
+            HistoryManager._atexit_registered = True
 
     @staticmethod
     def _escape(entry: str) -> str:
@@ -53,22 +105,10 @@ class HistoryManager:
     @staticmethod
     def _unescape(line: str) -> str:
         """Unescape a line back to multi-line entry."""
-        result = []
-        i = 0
-        while i < len(line):
-            if line[i] == "\\" and i + 1 < len(line):
-                next_char = line[i + 1]
-                if next_char == "n":
-                    result.append("\n")
-                    i += 2
-                    continue
-                elif next_char == "\\":
-                    result.append("\\")
-                    i += 2
-                    continue
-            result.append(line[i])
-            i += 1
-        return "".join(result)
+        # Most entries hold no escapes; skip the substitution for them
+        if "\\" not in line:
+            return line
+        return _ESCAPE_RE.sub(_unescape_match, line)
 
     def _load(self) -> None:
         """
@@ -78,28 +118,224 @@ class HistoryManager:
         Multi-line entries are stored as single lines with escaped newlines.
         """
         try:
-            if os.path.exists(self.history_file):
-                with open(self.history_file, "r", encoding="utf-8") as f:
-                    lines = f.read().strip().split("\n")
-                    self.entries = [
-                        self._unescape(line) for line in lines if line.strip()
-                    ]
+            # Stream the file, keeping only the newest max_entries raw lines
+            # so older ones are never unescaped. A missing file is handled
+            # below like an unreadable one, without a separate exists check.
+            size = os.path.getsize(self.history_file)
+            head = 0
+            if size > TAIL_READ_THRESHOLD:
+                stream, head = self._read_tail(size)
+            else:
+                stream = open(
+                    self.history_file, "r", encoding="utf-8", buffering=1 << 16
+                )
+            with stream as f:
+                lines: "deque[str]" = deque(maxlen=self.max_entries)
+                for line in f:
+                    if not line.isspace():
+                        lines.append(line)
+                        self._file_lines += 1
+            if head and size > head:
+                # Estimate the unread lines from the ones read, so compaction
+                # still sees how much the file has outgrown max_entries
+                self._file_lines += head * self._file_lines // (size - head)
+            self.entries = [self._unescape(line.rstrip("\n")) for line in lines]
         except (IOError, OSError, UnicodeDecodeError):
-            # Handle corrupted file gracefully - start with empty history
+            # Missing or corrupted file - start with empty history
             self.entries = []
         self.position = len(self.entries)  # Start at end (newest)
 
-    def _save(self) -> None:
-        """Save history to file, keeping only max_entries."""
+    def _read_tail(self, size: int) -> Tuple[TextIO, int]:
+        """
+        Read the end of a large history file holding its newest entries.
+
+        Blocks are read backwards until they hold max_entries non-blank
+        lines, so loading costs O(max_entries) whatever the file size.
+
+        Returns:
+            The tail as a text stream of whole lines, and the number of
+            unread bytes before it
+        """
+        pos = size
+        chunks: List[bytes] = []
+        newlines = 0
+        with open(self.history_file, "rb") as f:
+            while pos > 0:
+                step = min(TAIL_READ_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+                if newlines > self.max_entries:
+                    # Enough lines unless some are blank; the first may be
+                    # cut off and is not counted
+                    data = b"".join(reversed(chunks))
+                    whole = data.split(b"\n")[1:]
+                    if sum(1 for line in whole if line.strip()) >= self.max_entries:
+                        break
+        data = b"".join(reversed(chunks))
+        if pos > 0:
+            data = data[data.index(b"\n") + 1 :]
+        return io.StringIO(data.decode("utf-8"), newline=None), size - len(data)
+
+    def _save(self, entries: List[str]) -> None:
+        """
+        Rewrite the history file with the given entries.
+
+        The new content is written to a temporary file in the same directory
+        and moved over the old one, so a failed save never truncates history.
+        """
+        self._close_file()
+        tmp_path = None
         try:
-            # Keep only max_entries
-            entries_to_save = self.entries[-self.max_entries :]
             # Escape each entry so multi-line content becomes single line
-            escaped = [self._escape(entry) for entry in entries_to_save]
-            with open(self.history_file, "w", encoding="utf-8") as f:
-                f.write("\n".join(escaped) + "\n")
+            escaped = [self._escape(entry) for entry in entries]
+            directory = os.path.dirname(os.path.abspath(self.history_file))
+            fd, tmp_path = tempfile.mkstemp(prefix=".ouroboros-history-", dir=directory)
+            data = ("\n".join(escaped) + "\n").encode("utf-8")
+            with io.BufferedWriter(io.FileIO(fd, "w"), WRITE_BUFFER_SIZE) as f:
+                f.write(data)
+                # One fsync before the rename, so the replaced file is never
+                # observed empty after a crash
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                # mkstemp creates 0600; keep the existing file's permissions
+                os.chmod(tmp_path, os.stat(self.history_file).st_mode & 0o777)
+            except OSError:
+                pass
+            os.replace(tmp_path, self.history_file)
+            tmp_path = None
         except (IOError, OSError):
             pass  # Silently fail on save errors
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _open_append(self) -> BinaryIO:
+        """Open the long-lived append handle, fixing a missing final newline."""
+        needs_newline = False
+        try:
+            with open(self.history_file, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell():
+                    f.seek(-1, os.SEEK_END)
+                    needs_newline = f.read(1) != b"\n"
+        except (IOError, OSError):
+            pass
+        self._file = open(self.history_file, "ab")
+        if needs_newline:
+            self._file.write(b"\n")
+        return self._file
+
+    def _write_entries(self, entries: List[str]) -> None:
+        """Append entries to the history file in a single write."""
+        if not entries:
+            return
+        try:
+            f = self._file or self._open_append()
+            f.write(
+                b"".join(
+                    self._escape(entry).encode("utf-8") + b"\n" for entry in entries
+                )
+            )
+            f.flush()
+        except (IOError, OSError):
+            self._close_file()  # Silently fail on save errors
+
+    def _writer_loop(self) -> None:
+        """
+        Apply queued history writes until a None sentinel arrives.
+
+        Items are ("append", entry) or ("compact", entries). Appends that
+        arrive within COALESCE_WINDOW of each other share one write.
+        """
+        write_queue = self._write_queue
+        while True:
+            batch = [write_queue.get()]
+            deadline = time.monotonic() + COALESCE_WINDOW
+            while batch[-1] is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            pending: List[str] = []
+            for item in batch:
+                if item is None:
+                    self._write_entries(pending)
+                    self._close_file()
+                    return
+                kind, payload = item
+                if kind == "append":
+                    pending.append(payload)
+                else:
+                    self._write_entries(pending)
+                    pending = []
+                    self._save(payload)
+            self._write_entries(pending)
+
+    def _append(self, entry: str) -> None:
+        """
+        Queue one entry for the writer thread.
+
+        Once the file holds more than max_entries plus the compaction slack
+        (see COMPACT_SLACK), a snapshot is queued instead, so the file is
+        rewritten without entries beyond max_entries. Histories below that
+        size are only appended to.
+        """
+        max_entries = self.max_entries
+        if len(self.entries) > max_entries:
+            del self.entries[:-max_entries]
+        slack = max(COMPACT_SLACK, max_entries // COMPACT_DIVISOR)
+        if self._file_lines >= max_entries + slack:
+            self._file_lines = len(self.entries)
+            message = ("compact", list(self.entries))
+        else:
+            self._file_lines += 1
+            message = ("append", entry)
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="history-writer", daemon=True
+            )
+            self._writer.start()
+        self._write_queue.put(message)
+
+    def _close_file(self) -> None:
+        """Close the append handle if it is open."""
+        f = self._file
+        self._file = None
+        if f is not None:
+            try:
+                f.close()
+            except (IOError, OSError):
+                pass
+
+    def commit_history(self) -> None:
+        """Wait for queued history writes to reach the file."""
+        writer = self._writer
+        if writer is None:
+            return
+        self._writer = None
+        self._write_queue.put(None)
+        writer.join()
+
+    def flush(self) -> None:
+        """Write out pending history and release the file handle."""
+        self.commit_history()
+
+    @classmethod
+    def _flush_all(cls) -> None:
+        """Cleanup handler for atexit, covering every live manager."""
+        for manager in list(cls._instances):
+            manager.flush()
 
     def add(self, entry: str) -> None:
         """
@@ -117,7 +353,7 @@ class HistoryManager:
         if self.entries and self.entries[-1] == entry:
             return
         self.entries.append(entry)
-        self._save()
+        self._append(entry)
         self.reset_position()
 
     def reset_position(self) -> None:
@@ -167,6 +403,14 @@ class HistoryManager:
             return self._temp_current
         return self._temp_current
 
+    def _fold(self, entry: str) -> str:
+        """Return the lowercased entry, caching it for later searches."""
+        cache = self._fold_cache
+        if len(cache) >= 2 * self.max_entries:
+            cache.clear()
+        folded = cache[entry] = entry.lower()
+        return folded
+
     def search(self, query: str) -> List[str]:
         """
         Search history entries containing query.
@@ -184,11 +428,12 @@ class HistoryManager:
             # Return last 10 entries when no query
             return list(reversed(self.entries[-10:]))
 
-        # Find all entries containing the query (case-insensitive)
-        matches = [e for e in self.entries if query.lower() in e.lower()]
-
-        # Return in reverse order (most recent first)
-        return list(reversed(matches))
+        # Find all entries containing the query (case-insensitive),
+        # scanning newest first so results come out most recent first
+        needle = query.lower()
+        cached = self._fold_cache.get
+        fold = self._fold
+        return [e for e in reversed(self.entries) if needle in (cached(e) or fold(e))]
 
     def search_backward(self, query: str, start_index: int = None) -> Optional[str]:
         """
@@ -210,8 +455,11 @@ class HistoryManager:
             start_index = self.position - 1
 
         # Search backward from start_index
+        needle = query.lower()
+        cached = self._fold_cache.get
         for i in range(start_index, -1, -1):
-            if query.lower() in self.entries[i].lower():
+            entry = self.entries[i]
+            if needle in (cached(entry) or self._fold(entry)):
                 self.position = i
                 return self.entries[i]
 
@@ -237,3 +485,26 @@ class HistoryManager:
     def __len__(self) -> int:
         """Return number of history entries."""
         return len(self.entries)
+
+
+# Global history instance
+_history: Optional[HistoryManager] = None
+_history_lock = threading.Lock()
+
+
+def get_history() -> HistoryManager:
+    """Get or create global history manager (safe to call from any thread)."""
+    global _history
+    history = _history
+    if history is None:
+        with _history_lock:
+            history = _history
+            if history is None:
+                history = _history = HistoryManager()
+    return history
+
+
+def reset_global_history() -> None:
+    """Reset global history instance (useful for testing)."""
+    global _history
+    _history = None
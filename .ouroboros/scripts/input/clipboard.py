@@ -7,15 +7,186 @@ win32clipboard/ctypes on Windows and xclip/xsel/pbpaste on Unix.
 
 """
 
+import os
 import sys
+import time
+import atexit
+import shlex
+import shutil
+import tempfile
 import subprocess
-from typing import Optional
+from typing import List, Optional
 
 # Platform detection
 IS_WINDOWS = sys.platform == "win32"
 IS_MACOS = sys.platform == "darwin"
 IS_LINUX = sys.platform.startswith("linux")
 
+CF_UNICODETEXT = 13
+
+if IS_WINDOWS:
+    import ctypes
+    from ctypes import wintypes
+
+    # Clipboard prototypes are set up once instead of on every read
+    _USER32 = ctypes.WinDLL("user32", use_last_error=True)
+    _KERNEL32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _IsClipboardFormatAvailable = _USER32.IsClipboardFormatAvailable
+    _IsClipboardFormatAvailable.argtypes = [wintypes.UINT]
+    _IsClipboardFormatAvailable.restype = wintypes.BOOL
+
+    _OpenClipboard = _USER32.OpenClipboard
+    _OpenClipboard.argtypes = [wintypes.HWND]
+    _OpenClipboard.restype = wintypes.BOOL
+
+    _CloseClipboard = _USER32.CloseClipboard
+    _CloseClipboard.argtypes = []
+    _CloseClipboard.restype = wintypes.BOOL
+
+    _GetClipboardData = _USER32.GetClipboardData
+    _GetClipboardData.argtypes = [wintypes.UINT]
+    _GetClipboardData.restype = ctypes.c_void_p
+
+    _GlobalLock = _KERNEL32.GlobalLock
+    _GlobalLock.argtypes = [ctypes.c_void_p]
+    _GlobalLock.restype = ctypes.c_void_p
+
+    _GlobalUnlock = _KERNEL32.GlobalUnlock
+    _GlobalUnlock.argtypes = [ctypes.c_void_p]
+    _GlobalUnlock.restype = wintypes.BOOL
+
+    _wstring_at = ctypes.wstring_at
+
+
+def _find_linux_clip_cmds() -> List[List[str]]:
+    """Return the command lines of the installed clipboard tools, in order."""
+    candidates = [
+        ("xclip", ["-selection", "clipboard", "-o"]),
+        ("xsel", ["--clipboard", "--output"]),
+        ("wl-paste", []),
+    ]
+    return [[tool, *args] for tool, args in candidates if shutil.which(tool)]
+
+
+# Resolved once so reads don't probe for missing tools every time. Every
+# installed tool is kept: a read falls through to the next one when a tool
+# fails, e.g. xclip without an X display in a Wayland session.
+_LINUX_CLIP_CMDS: List[List[str]] = _find_linux_clip_cmds() if IS_LINUX else []
+
+# Long-lived shell that runs the clipboard commands (its positional args after
+# the scratch file path, one quoted command line each) in turn until one
+# succeeds, each time it reads a line on stdin, and replies with
+# "<byte count>\n<content>". Reads then cost a pipe round trip instead of
+# forking the Python process. The scratch file is unlinked before the shell
+# starts and reached through /dev/fd, so clipboard contents never sit in a
+# named file; each command runs in the background so a signal to the shell
+# also stops a hung clipboard tool.
+_CLIP_HELPER_SCRIPT = r"""
+f=$1
+shift
+pid=
+trap '[ -n "$pid" ] && kill "$pid" 2>/dev/null' EXIT
+trap 'exit 1' HUP INT TERM
+while read -r _; do
+    for cmd; do
+        eval "exec $cmd" >"$f" 2>/dev/null </dev/null &
+        pid=$!
+        wait "$pid" && break
+        : >"$f"
+    done
+    pid=
+    wc -c <"$f"
+    cat "$f"
+done
+"""
+
+_clip_proc: Optional[subprocess.Popen] = None
+
+
+def _start_clip_helper() -> subprocess.Popen:
+    """Start the clipboard helper with an anonymous scratch file."""
+    with tempfile.TemporaryFile() as scratch:
+        fd = scratch.fileno()
+        return subprocess.Popen(
+            ["sh", "-c", _CLIP_HELPER_SCRIPT, "sh", f"/dev/fd/{fd}"]
+            + [shlex.join(cmd) for cmd in _LINUX_CLIP_CMDS],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            pass_fds=(fd,),
+        )
+
+
+def _stop_clip_helper() -> None:
+    """Stop the clipboard helper so the next read starts a fresh one."""
+    global _clip_proc
+    proc = _clip_proc
+    _clip_proc = None
+    if proc is None:
+        return
+    try:
+        # EOF ends the read loop; TERM interrupts a read stuck in the tool
+        proc.stdin.close()
+        proc.terminate()
+        proc.wait(timeout=1)
+    except Exception:
+        try:
+            proc.kill()
+            proc.wait(timeout=1)
+        except Exception:
+            pass
+    try:
+        proc.stdout.close()
+    except Exception:
+        pass
+
+
+atexit.register(_stop_clip_helper)
+
+
+def _read_framed(fd: int, deadline: float) -> bytes:
+    """Read one "<size>\\n<payload>" reply from the helper's stdout."""
+    import select
+
+    buf = bytearray()
+    size = None
+    while True:
+        if size is None:
+            newline = buf.find(b"\n")
+            if newline != -1:
+                size = int(buf[:newline])
+                del buf[: newline + 1]
+        if size is not None and len(buf) >= size:
+            return bytes(buf[:size])
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+            raise TimeoutError("clipboard helper did not answer")
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            raise EOFError("clipboard helper exited")
+        buf += chunk
+
+
+def _read_clip_helper(timeout: float = 2.0) -> Optional[bytes]:
+    """
+    Read the Linux clipboard through the persistent helper process.
+
+    Returns:
+        The raw clipboard bytes, or None if the helper is unusable and the
+        caller should fall back to one-shot subprocess calls.
+    """
+    global _clip_proc
+    proc = _clip_proc
+    try:
+        if proc is None or proc.poll() is not None:
+            proc = _clip_proc = _start_clip_helper()
+        os.write(proc.stdin.fileno(), b"GET\n")
+        return _read_framed(proc.stdout.fileno(), time.monotonic() + timeout)
+    except Exception:
+        _stop_clip_helper()
+        return None
+
 
 class ClipboardManager:
     """Cross-platform clipboard access."""
@@ -41,89 +212,58 @@ class ClipboardManager:
     def _read_windows(self) -> str:
         """Read clipboard on Windows using ctypes."""
         try:
-            import ctypes
-            from ctypes import wintypes
-
-            user32 = ctypes.windll.user32
-            kernel32 = ctypes.windll.kernel32
-
-            CF_UNICODETEXT = 13
+            # Lock-free format query; skip taking the clipboard when there
+            # is no text on it
+            if not _IsClipboardFormatAvailable(CF_UNICODETEXT):
+                return ""
 
-            if not user32.OpenClipboard(None):
+            if not _OpenClipboard(None):
                 return ""
 
             try:
-                handle = user32.GetClipboardData(CF_UNICODETEXT)
+                handle = _GetClipboardData(CF_UNICODETEXT)
                 if not handle:
                     return ""
 
-                kernel32.GlobalLock.restype = ctypes.c_void_p
-                ptr = kernel32.GlobalLock(handle)
+                ptr = _GlobalLock(handle)
                 if not ptr:
                     return ""
 
                 try:
-                    return ctypes.wstring_at(ptr)
+                    return _wstring_at(ptr)
                 finally:
-                    kernel32.GlobalUnlock(handle)
+                    _GlobalUnlock(handle)
             finally:
-                user32.CloseClipboard()
+                _CloseClipboard()
         except Exception:
             return ""
 
     def _read_macos(self) -> str:
         """Read clipboard on macOS using pbpaste."""
         try:
-            result = subprocess.run(
-                ["pbpaste"], capture_output=True, text=True, timeout=2
-            )
-            return result.stdout if result.returncode == 0 else ""
+            result = subprocess.run(["pbpaste"], capture_output=True, timeout=2)
+            if result.returncode == 0:
+                return result.stdout.decode("utf-8", "replace")
+            return ""
         except Exception:
             return ""
 
     def _read_linux(self) -> str:
         """Read clipboard on Linux using xclip, xsel, or wl-paste."""
-        # Try xclip first
-        try:
-            result = subprocess.run(
-                ["xclip", "-selection", "clipboard", "-o"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if result.returncode == 0:
-                return result.stdout
-        except FileNotFoundError:
-            pass
-        except Exception:
-            pass
+        if not _LINUX_CLIP_CMDS:
+            return ""
 
-        # Try xsel
-        try:
-            result = subprocess.run(
-                ["xsel", "--clipboard", "--output"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if result.returncode == 0:
-                return result.stdout
-        except FileNotFoundError:
-            pass
-        except Exception:
-            pass
+        data = _read_clip_helper()
+        if data is not None:
+            return data.decode("utf-8", "replace")
 
-        # Try wl-paste for Wayland
-        try:
-            result = subprocess.run(
-                ["wl-paste"], capture_output=True, text=True, timeout=2
-            )
-            if result.returncode == 0:
-                return result.stdout
-        except FileNotFoundError:
-            pass
-        except Exception:
-            pass
+        for cmd in _LINUX_CLIP_CMDS:
+            try:
+                result = subprocess.run(cmd, capture_output=True, timeout=2)
+                if result.returncode == 0:
+                    return result.stdout.decode("utf-8", "replace")
+            except Exception:
+                pass
 
         return ""
 
@@ -133,31 +273,12 @@ class ClipboardManager:
             return self._available
 
         if IS_WINDOWS:
-            try:
-                import ctypes
-
-                ctypes.windll.user32
-                self._available = True
-            except Exception:
-                self._available = False
+            # Prototypes were bound at import; the DLL is always present
+            self._available = True
         elif IS_MACOS:
-            try:
-                result = subprocess.run(
-                    ["which", "pbpaste"], capture_output=True, timeout=1
-                )
-                self._available = result.returncode == 0
-            except Exception:
-                self._available = False
+            self._available = shutil.which("pbpaste") is not None
         elif IS_LINUX:
-            for cmd in [["which", "xclip"], ["which", "xsel"], ["which", "wl-paste"]]:
-                try:
-                    result = subprocess.run(cmd, capture_output=True, timeout=1)
-                    if result.returncode == 0:
-                        self._available = True
-                        return True
-                except Exception:
-                    pass
-            self._available = False
+            self._available = bool(_LINUX_CLIP_CMDS)
         else:
             self._available = False
 
@@ -28,6 +28,74 @@ SLASH_COMMANDS: Dict[str, Dict[str, str]] = {
     },
 }
 
+# (command, lowercase name without "/") pairs, computed once for matching
+_CMD_INDEX: List[Tuple[str, str]] = [(cmd, cmd[1:].lower()) for cmd in SLASH_COMMANDS]
+
+
+def _build_command_trie(index: List[Tuple[str, str]]) -> dict:
+    """
+    Build a prefix trie over lowercase command names.
+
+    Each node maps a character to its child node; the "" key holds every
+    command below that node in SLASH_COMMANDS order, so a prefix lookup is
+    a walk down the trie with no per-command work.
+    """
+    root: dict = {"": []}
+    for cmd, name in index:
+        node = root
+        node[""].append(cmd)
+        for ch in name:
+            node = node.setdefault(ch, {"": []})
+            node[""].append(cmd)
+    return root
+
+
+_CMD_TRIE = _build_command_trie(_CMD_INDEX)
+
+
+def _build_slash_trie(commands: Dict[str, Dict[str, str]]) -> dict:
+    """
+    Build a character trie of full commands.
+
+    "__END__" marks a command and holds its ready-made instruction prefix
+    ("" for commands without an agent file), so dispatch does no formatting.
+    """
+    root: dict = {}
+    for cmd, info in commands.items():
+        node = root
+        for ch in cmd:
+            node = node.setdefault(ch, {})
+        agent_file = info.get("file", "")
+        node["__END__"] = (
+            f"Follow the prompt '.github/agents/{agent_file}'\n\n" if agent_file else ""
+        )
+    return root
+
+
+_SLASH_TRIE = _build_slash_trie(SLASH_COMMANDS)
+
+# What may follow a complete command ("" is end of input)
+_COMMAND_BOUNDARY = frozenset(("", " ", "\n", "\t"))
+
+
+def _match_slash_command(text: str) -> Optional[str]:
+    """
+    Find the longest command that starts text and is followed by a boundary.
+
+    Returns:
+        That command's instruction prefix ("" if it has no agent file),
+        or None if text does not start with a command
+    """
+    prefix = None
+    node = _SLASH_TRIE
+    for depth, ch in enumerate(text):
+        node = node.get(ch)
+        if node is None:
+            break
+        if "__END__" in node and text[depth + 1 : depth + 2] in _COMMAND_BOUNDARY:
+            prefix = node["__END__"]
+    return prefix
+
 
 class SlashCommandHandler:
     """Handles slash command detection and autocomplete suggestions."""
@@ -37,6 +105,31 @@ class SlashCommandHandler:
         self.prefix = ""
         self.matches: List[str] = []
         self.selected_index = 0
+        # Last prefix walk, so typing another character descends one node
+        self._trie_term = ""
+        self._trie_node: Optional[dict] = _CMD_TRIE
+        # (matches list, selected_index, max_width) -> formatted output; the
+        # matches list is replaced, never mutated, whenever it changes
+        self._lines_key: Optional[tuple] = None
+        self._lines_cache: List[str] = []
+        self._items_for: Optional[List[str]] = None
+        self._items_cache: List[Tuple[str, str]] = []
+
+    def _prefix_matches(self, search_term: str) -> List[str]:
+        """Return commands whose name starts with search_term via the trie."""
+        if self._trie_node is not None and search_term.startswith(self._trie_term):
+            node = self._trie_node
+            rest = search_term[len(self._trie_term) :]
+        else:
+            node = _CMD_TRIE
+            rest = search_term
+        for ch in rest:
+            node = node.get(ch)
+            if node is None:
+                break
+        self._trie_term = search_term
+        self._trie_node = node
+        return list(node[""]) if node is not None else []
 
     def start(self, char: str = "/") -> bool:
         """Start command mode if char is '/'. Returns True if started."""
@@ -52,9 +145,9 @@ class SlashCommandHandler:
         """
         Update matches based on current prefix using fuzzy matching.
 
-        Priority:
-        1. Commands that start with the search term
-        2. Commands that contain the search term elsewhere
+        Commands that start with the search term are looked up in a prefix
+        trie; only when none do, commands containing the term elsewhere are
+        returned instead.
 
         Args:
             prefix: The current input prefix (including leading /)
@@ -69,15 +162,9 @@ class SlashCommandHandler:
             if not search_term:
                 self.matches = list(SLASH_COMMANDS.keys())
             else:
-                starts_with = []
-                contains = []
-                for cmd in SLASH_COMMANDS:
-                    cmd_name = cmd[1:].lower()
-                    if cmd_name.startswith(search_term):
-                        starts_with.append(cmd)
-                    elif search_term in cmd_name:
-                        contains.append(cmd)
-                self.matches = starts_with + contains
+                self.matches = self._prefix_matches(search_term) or [
+                    cmd for cmd, name in _CMD_INDEX if search_term in name
+                ]
 
             if self.selected_index >= len(self.matches):
                 self.selected_index = max(0, len(self.matches) - 1)
@@ -130,9 +217,19 @@ class SlashCommandHandler:
         self.prefix = ""
         self.matches = []
         self.selected_index = 0
+        self._trie_term = ""
+        self._trie_node = _CMD_TRIE
 
     def get_dropdown_lines(self, max_width: int = 60) -> List[str]:
         """Get formatted dropdown lines for display."""
+        key = self._lines_key
+        if (
+            key is not None
+            and key[0] is self.matches
+            and key[1] == self.selected_index
+            and key[2] == max_width
+        ):
+            return self._lines_cache
         lines = []
         for i, cmd in enumerate(self.matches):
             info = SLASH_COMMANDS.get(cmd, {})
@@ -140,15 +237,21 @@ class SlashCommandHandler:
             marker = ">" if i == self.selected_index else " "
             line = f"{marker} {cmd:<25} — {desc}"
             lines.append(line[:max_width])
+        self._lines_key = (self.matches, self.selected_index, max_width)
+        self._lines_cache = lines
         return lines
 
     def get_dropdown_items(self) -> List[Tuple[str, str]]:
         """Get items for dropdown display as (command, description) tuples."""
+        if self._items_for is self.matches:
+            return self._items_cache
         items = []
         for cmd in self.matches:
             info = SLASH_COMMANDS.get(cmd, {})
             desc = info.get("desc", "")
             items.append((cmd, desc))
+        self._items_for = self.matches
+        self._items_cache = items
         return items
 
 
@@ -168,22 +271,8 @@ def prepend_instruction(content: str) -> str:
         Content with agent instruction prepended if slash command detected,
         otherwise returns content unchanged
     """
-    content_stripped = content.strip()
-
-    # Sort by length descending to match longer commands first
-    for cmd in sorted(SLASH_COMMANDS.keys(), key=len, reverse=True):
-        if content_stripped.startswith(cmd):
-            # Check that it's a complete command (followed by space, newline, or end)
-            rest = content_stripped[len(cmd) :]
-            if not rest or rest[0] in (" ", "\n", "\t"):
-                info = SLASH_COMMANDS[cmd]
-                agent_file = info.get("file", "")
-                if agent_file:
-                    prompt_path = f".github/agents/{agent_file}"
-                    prefix = f"Follow the prompt '{prompt_path}'\n\n"
-                    return prefix + content
-
-    return content
+    prefix = _match_slash_command(content.strip())
+    return prefix + content if prefix else content
 
 
 def get_agent_file_for_command(command: str) -> Optional[str]:
@@ -212,10 +301,4 @@ def is_valid_slash_command(text: str) -> bool:
     Returns:
         True if text starts with a valid slash command
     """
-    text_stripped = text.strip()
-    for cmd in SLASH_COMMANDS:
-        if text_stripped.startswith(cmd):
-            rest = text_stripped[len(cmd) :]
-            if not rest or rest[0] in (" ", "\n", "\t"):
-                return True
-    return False
+    return _match_slash_command(text.strip()) is not None
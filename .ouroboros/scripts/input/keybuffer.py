@@ -129,16 +129,23 @@ class Keys:
     F12 = "\x1b[24~"
 
 
+# Intern key constants so equality checks can short-circuit on identity
+for _name, _value in list(vars(Keys).items()):
+    if isinstance(_value, str) and not _name.startswith("_"):
+        setattr(Keys, _name, sys.intern(_value))
+del _name, _value
+
+
+# Printable flags for Latin-1; C0/C1 controls and DEL are 0
+_LOW_PRINTABLE = bytes(1 if 0x20 <= c < 0x7F or c >= 0xA0 else 0 for c in range(256))
+
+
 def is_printable(char: str) -> bool:
     """Check if character is printable (not control character). Supports Unicode."""
     if not char or len(char) != 1:
         return False
     code = ord(char)
-    if code < 0x20 or code == 0x7F:
-        return False
-    if 0x80 <= code <= 0x9F:
-        return False
-    return True
+    return code >= 0xA0 or bool(_LOW_PRINTABLE[code])
 
 
 def is_pipe_input() -> bool:
@@ -217,6 +224,12 @@ class KeyBuffer:
             return self._impl.read_all_pending()
         return ""
 
+    def getch_batch(self, max_chars: int = 4096) -> str:
+        """Read a run of pasted text in one call while pasting (Windows only)."""
+        if hasattr(self._impl, "getch_batch"):
+            return self._impl.getch_batch(max_chars)
+        return ""
+
     def is_ctrl_v_pressed(self) -> bool:
         """Check if Ctrl+V is currently pressed (Windows only, uses GetAsyncKeyState)."""
         if hasattr(self._impl, "is_ctrl_v_pressed"):
@@ -20,108 +20,80 @@ if IS_POSIX:
     import termios
     import select
 
-
-class Keys:
-    """Key constants for special keys and modifiers."""
-
-    # Basic keys
-    ENTER = "\r"
-    NEWLINE = "\n"
-    TAB = "\t"
-    ESCAPE = "\x1b"
-    BACKSPACE = "\x7f"
-    BACKSPACE_WIN = "\x08"
-
-    # Ctrl combinations
-    CTRL_A = "\x01"
-    CTRL_B = "\x02"
-    CTRL_C = "\x03"
-    CTRL_D = "\x04"
-    CTRL_E = "\x05"
-    CTRL_F = "\x06"
-    CTRL_G = "\x07"
-    CTRL_H = "\x08"
-    CTRL_I = "\x09"
-    CTRL_J = "\x0a"
-    CTRL_K = "\x0b"
-    CTRL_L = "\x0c"
-    CTRL_M = "\x0d"
-    CTRL_N = "\x0e"
-    CTRL_O = "\x0f"
-    CTRL_P = "\x10"
-    CTRL_Q = "\x11"
-    CTRL_R = "\x12"
-    CTRL_S = "\x13"
-    CTRL_T = "\x14"
-    CTRL_U = "\x15"
-    CTRL_V = "\x16"
-    CTRL_W = "\x17"
-    CTRL_X = "\x18"
-    CTRL_Y = "\x19"
-    CTRL_Z = "\x1a"
-
-    # Special Enter variants
-    SHIFT_ENTER = "SHIFT_ENTER"
-    CTRL_ENTER = "CTRL_ENTER"
-    ALT_ENTER = "ALT_ENTER"
-    CTRL_SHIFT_ENTER = "CTRL_SHIFT_ENTER"
-    SOFT_NEWLINE = "\x0a"
-
-    # Arrow keys (ANSI escape sequences)
-    UP = "\x1b[A"
-    DOWN = "\x1b[B"
-    RIGHT = "\x1b[C"
-    LEFT = "\x1b[D"
-
-    # Arrow keys (alternate sequences)
-    UP_ALT = "\x1bOA"
-    DOWN_ALT = "\x1bOB"
-    RIGHT_ALT = "\x1bOC"
-    LEFT_ALT = "\x1bOD"
-
-    # Navigation keys
-    HOME = "\x1b[H"
-    END = "\x1b[F"
-    HOME_ALT = "\x1b[1~"
-    END_ALT = "\x1b[4~"
-    INSERT = "\x1b[2~"
-    DELETE = "\x1b[3~"
-    PAGE_UP = "\x1b[5~"
-    PAGE_DOWN = "\x1b[6~"
-
-    # Ctrl+Arrow
-    CTRL_UP = "\x1b[1;5A"
-    CTRL_DOWN = "\x1b[1;5B"
-    CTRL_RIGHT = "\x1b[1;5C"
-    CTRL_LEFT = "\x1b[1;5D"
-
-    # Shift+Arrow
-    SHIFT_UP = "\x1b[1;2A"
-    SHIFT_DOWN = "\x1b[1;2B"
-    SHIFT_RIGHT = "\x1b[1;2C"
-    SHIFT_LEFT = "\x1b[1;2D"
-
-
-def is_printable(char: str) -> bool:
-    """Check if character is printable (not control character). Supports Unicode."""
-    if not char or len(char) != 1:
-        return False
-    code = ord(char)
-    if code < 0x20 or code == 0x7F:
-        return False
-    if 0x80 <= code <= 0x9F:
-        return False
-    return True
+from .keybuffer import Keys, is_printable
+
+# CSI final byte -> key, for sequences without parameters (ESC [ A)
+_CSI_FINAL_MAP = {
+    "A": Keys.UP,
+    "B": Keys.DOWN,
+    "C": Keys.RIGHT,
+    "D": Keys.LEFT,
+    "H": Keys.HOME,
+    "F": Keys.END,
+}
+
+# CSI final byte -> key, for Ctrl-modified sequences (ESC [ 1 ; 5 A)
+_CSI_CTRL_MAP = {
+    "A": Keys.CTRL_UP,
+    "B": Keys.CTRL_DOWN,
+    "C": Keys.CTRL_RIGHT,
+    "D": Keys.CTRL_LEFT,
+}
+
+# CSI parameter -> key, for tilde-terminated sequences (ESC [ 3 ~)
+_CSI_TILDE_MAP = {
+    1: Keys.HOME,
+    3: Keys.DELETE,
+    4: Keys.END,
+    5: Keys.PAGE_UP,
+    6: Keys.PAGE_DOWN,
+}
+
+# SS3 final byte -> key (ESC O A)
+_SS3_FINAL_MAP = {
+    "A": Keys.UP,
+    "B": Keys.DOWN,
+    "C": Keys.RIGHT,
+    "D": Keys.LEFT,
+}
+
+
+def _dispatch_csi(final: str, params: list) -> Optional[str]:
+    """Map a parsed CSI sequence to its canonical key, or None if unknown."""
+    if not params:
+        return _CSI_FINAL_MAP.get(final)
+    if final == "~":
+        return _CSI_TILDE_MAP.get(params[0]) if len(params) == 1 else None
+    if params == [1, 5]:
+        return _CSI_CTRL_MAP.get(final)
+    if final == "u" and params == [13, 6]:
+        return Keys.CTRL_SHIFT_ENTER
+    return None
 
 
 class UnixKeyBuffer:
     """Unix/Linux/macOS keyboard input handler using termios."""
 
+    _ENTER_KEYS = frozenset(
+        (
+            "\r",
+            "\n",
+            Keys.ENTER,
+            Keys.NEWLINE,
+            Keys.SHIFT_ENTER,
+            Keys.CTRL_ENTER,
+            Keys.ALT_ENTER,
+            Keys.CTRL_SHIFT_ENTER,
+        )
+    )
+    _BACKSPACE_KEYS = frozenset((Keys.BACKSPACE, Keys.BACKSPACE_WIN, Keys.CTRL_H))
+    _DELETE_KEYS = frozenset((Keys.DELETE,))
+
     def __init__(self):
         self._old_settings = None
         self._fd = None
-        self._last_key_time = 0
-        self._paste_threshold = 0.02
+        self._last_key_ns = 0
+        self._paste_threshold_ns = 20_000_000  # 20ms between keys
         self._is_pasting = False
 
     def __enter__(self):
@@ -155,7 +127,7 @@ class UnixKeyBuffer:
             return sys.stdin.read(1) if sys.stdin.readable() else ""
 
         if timeout is not None:
-            ready, _, _ = select.select([sys.stdin], [], [], timeout)
+            ready, _, _ = select.select([self._fd], [], [], timeout)
             if not ready:
                 return ""
 
@@ -184,40 +156,64 @@ class UnixKeyBuffer:
             return ""
 
     def _read_escape_sequence(self) -> str:
-        """Read and parse an escape sequence."""
-        seq = "\x1b"
-
+        """Read an escape sequence and return its canonical key."""
         char = self._read_char(timeout=0.05)
         if not char:
-            return seq
-
-        seq += char
+            return Keys.ESCAPE
 
         # CSI sequence: ESC [
         if char == "[":
-            while True:
-                char = self._read_char(timeout=0.02)
-                if not char:
-                    break
-                seq += char
-                if char.isalpha() or char == "~":
-                    break
-                if char == ";":
-                    continue
-                if char.isdigit():
-                    continue
+            return self._read_csi_sequence()
 
         # SS3 sequence: ESC O
-        elif char == "O":
+        if char == "O":
             char = self._read_char(timeout=0.02)
-            if char:
-                seq += char
+            return _SS3_FINAL_MAP.get(char) or "\x1bO" + char
 
         # Alt+Enter: ESC + \r
-        elif char == "\r":
+        if char == "\r":
             return Keys.ALT_ENTER
 
-        return seq
+        return "\x1b" + char
+
+    def _read_csi_sequence(self) -> str:
+        """
+        Read the remainder of a CSI sequence (after ESC [).
+
+        Numeric parameters are accumulated as ints and the final byte is
+        resolved through lookup tables, so known keys never build the raw
+        sequence string. Unknown sequences are returned verbatim.
+        """
+        params = []
+        cur = 0
+        has_digits = False
+        intermediates = False
+        raw = ["\x1b["]
+
+        while True:
+            char = self._read_char(timeout=0.02)
+            if not char:
+                return "".join(raw)
+            raw.append(char)
+            if "0" <= char <= "9":
+                cur = cur * 10 + ord(char) - 0x30
+                has_digits = True
+            elif char == ";":
+                params.append(cur)
+                cur = 0
+            elif char.isalpha() or char == "~":
+                break
+            else:
+                intermediates = True
+
+        if has_digits or params:
+            params.append(cur)
+
+        if not intermediates:
+            key = _dispatch_csi(char, params)
+            if key is not None:
+                return key
+        return "".join(raw)
 
     def getch(self, timeout: Optional[float] = None) -> str:
         """Read a single key or key sequence."""
@@ -228,59 +224,13 @@ class UnixKeyBuffer:
         if not char:
             return ""
 
-        current_time = time.time()
-        time_since_last = current_time - self._last_key_time
-        self._is_pasting = time_since_last < self._paste_threshold
-        self._last_key_time = current_time
+        now = time.monotonic_ns()
+        self._is_pasting = (now - self._last_key_ns) < self._paste_threshold_ns
+        self._last_key_ns = now
 
         # Handle escape sequences
         if char == "\x1b":
-            seq = self._read_escape_sequence()
-            # Check for Ctrl+Shift+Enter
-            if seq == "\x1b[13;6u":
-                return Keys.CTRL_SHIFT_ENTER
-
-            # Parse common sequences
-            if seq == "\x1b[A":
-                return Keys.UP
-            elif seq == "\x1b[B":
-                return Keys.DOWN
-            elif seq == "\x1b[C":
-                return Keys.RIGHT
-            elif seq == "\x1b[D":
-                return Keys.LEFT
-            elif seq == "\x1b[H":
-                return Keys.HOME
-            elif seq == "\x1b[F":
-                return Keys.END
-            elif seq == "\x1b[3~":
-                return Keys.DELETE
-            elif seq == "\x1b[1~":
-                return Keys.HOME
-            elif seq == "\x1b[4~":
-                return Keys.END
-            elif seq == "\x1b[5~":
-                return Keys.PAGE_UP
-            elif seq == "\x1b[6~":
-                return Keys.PAGE_DOWN
-            elif seq == "\x1b[1;5A":
-                return Keys.CTRL_UP
-            elif seq == "\x1b[1;5B":
-                return Keys.CTRL_DOWN
-            elif seq == "\x1b[1;5C":
-                return Keys.CTRL_RIGHT
-            elif seq == "\x1b[1;5D":
-                return Keys.CTRL_LEFT
-            elif seq == "\x1bOA":
-                return Keys.UP
-            elif seq == "\x1bOB":
-                return Keys.DOWN
-            elif seq == "\x1bOC":
-                return Keys.RIGHT
-            elif seq == "\x1bOD":
-                return Keys.LEFT
-
-            return seq
+            return self._read_escape_sequence()
 
         # Handle Enter variants
         if char == "\r":
@@ -306,24 +256,15 @@ class UnixKeyBuffer:
 
     def is_enter(self, key: str) -> bool:
         """Check if key is any Enter variant."""
-        return key in (
-            "\r",
-            "\n",
-            Keys.ENTER,
-            Keys.NEWLINE,
-            Keys.SHIFT_ENTER,
-            Keys.CTRL_ENTER,
-            Keys.ALT_ENTER,
-            Keys.CTRL_SHIFT_ENTER,
-        )
+        return key in self._ENTER_KEYS
 
     def is_backspace(self, key: str) -> bool:
         """Check if key is Backspace."""
-        return key in (Keys.BACKSPACE, Keys.BACKSPACE_WIN, Keys.CTRL_H, "\x08")
+        return key in self._BACKSPACE_KEYS
 
     def is_delete(self, key: str) -> bool:
         """Check if key is Delete."""
-        return key == Keys.DELETE
+        return key in self._DELETE_KEYS
 
     def is_printable(self, key: str) -> bool:
         """Check if key is a printable character (including CJK)."""
@@ -9,134 +9,259 @@ for IME support and VK code handling for arrow keys.
 
 import sys
 import time
-from typing import Optional
+from collections import deque
+from typing import Callable, Optional
+
+from .keybuffer import Keys, is_printable
 
 # Platform check
 IS_WINDOWS = sys.platform == "win32"
 
 if IS_WINDOWS:
     import msvcrt
-
-
-class Keys:
-    """Key constants for special keys and modifiers."""
-
-    # Basic keys
-    ENTER = "\r"
-    NEWLINE = "\n"
-    TAB = "\t"
-    ESCAPE = "\x1b"
-    BACKSPACE = "\x7f"
-    BACKSPACE_WIN = "\x08"
-
-    # Ctrl combinations
-    CTRL_A = "\x01"
-    CTRL_B = "\x02"
-    CTRL_C = "\x03"
-    CTRL_D = "\x04"
-    CTRL_E = "\x05"
-    CTRL_F = "\x06"
-    CTRL_G = "\x07"
-    CTRL_H = "\x08"
-    CTRL_I = "\x09"
-    CTRL_J = "\x0a"
-    CTRL_K = "\x0b"
-    CTRL_L = "\x0c"
-    CTRL_M = "\x0d"
-    CTRL_N = "\x0e"
-    CTRL_O = "\x0f"
-    CTRL_P = "\x10"
-    CTRL_Q = "\x11"
-    CTRL_R = "\x12"
-    CTRL_S = "\x13"
-    CTRL_T = "\x14"
-    CTRL_U = "\x15"
-    CTRL_V = "\x16"
-    CTRL_W = "\x17"
-    CTRL_X = "\x18"
-    CTRL_Y = "\x19"
-    CTRL_Z = "\x1a"
-
-    # Special Enter variants
-    SHIFT_ENTER = "SHIFT_ENTER"
-    CTRL_ENTER = "CTRL_ENTER"
-    ALT_ENTER = "ALT_ENTER"
-    CTRL_SHIFT_ENTER = "CTRL_SHIFT_ENTER"
-    SOFT_NEWLINE = "\x0a"
-
-    # Arrow keys (ANSI escape sequences)
-    UP = "\x1b[A"
-    DOWN = "\x1b[B"
-    RIGHT = "\x1b[C"
-    LEFT = "\x1b[D"
-
-    # Arrow keys (alternate sequences)
-    UP_ALT = "\x1bOA"
-    DOWN_ALT = "\x1bOB"
-    RIGHT_ALT = "\x1bOC"
-    LEFT_ALT = "\x1bOD"
-
-    # Navigation keys
-    HOME = "\x1b[H"
-    END = "\x1b[F"
-    HOME_ALT = "\x1b[1~"
-    END_ALT = "\x1b[4~"
-    INSERT = "\x1b[2~"
-    DELETE = "\x1b[3~"
-    PAGE_UP = "\x1b[5~"
-    PAGE_DOWN = "\x1b[6~"
-
-    # Ctrl+Arrow
-    CTRL_UP = "\x1b[1;5A"
-    CTRL_DOWN = "\x1b[1;5B"
-    CTRL_RIGHT = "\x1b[1;5C"
-    CTRL_LEFT = "\x1b[1;5D"
-
-    # Windows-specific key codes
-    WIN_SPECIAL_PREFIX = "\x00"
-    WIN_EXTENDED_PREFIX = "\xe0"
-    WIN_UP = "\xe0H"
-    WIN_DOWN = "\xe0P"
-    WIN_LEFT = "\xe0K"
-    WIN_RIGHT = "\xe0M"
-    WIN_HOME = "\xe0G"
-    WIN_END = "\xe0O"
-    WIN_INSERT = "\xe0R"
-    WIN_DELETE = "\xe0S"
-    WIN_PAGE_UP = "\xe0I"
-    WIN_PAGE_DOWN = "\xe0Q"
-
-    # Ctrl+Arrow (Windows)
-    WIN_CTRL_UP = "\xe0\x8d"
-    WIN_CTRL_DOWN = "\xe0\x91"
-    WIN_CTRL_LEFT = "\xe0s"
-    WIN_CTRL_RIGHT = "\xe0t"
-
-
-def is_printable(char: str) -> bool:
-    """Check if character is printable (not control character). Supports Unicode."""
-    if not char or len(char) != 1:
-        return False
-    code = ord(char)
-    if code < 0x20 or code == 0x7F:
-        return False
-    if 0x80 <= code <= 0x9F:
-        return False
-    return True
+    import ctypes
+    from ctypes import wintypes
+
+    # Bound once so the msvcrt fallback skips a module lookup per call
+    _kbhit = msvcrt.kbhit
+    _getwch = msvcrt.getwch
+
+    class KEY_EVENT_RECORD(ctypes.Structure):
+        _fields_ = [
+            ("bKeyDown", wintypes.BOOL),
+            ("wRepeatCount", wintypes.WORD),
+            ("wVirtualKeyCode", wintypes.WORD),
+            ("wVirtualScanCode", wintypes.WORD),
+            # Raw UTF-16 code unit; surrogate pairs are reassembled by the reader
+            ("uChar", wintypes.WORD),
+            ("dwControlKeyState", wintypes.DWORD),
+        ]
+
+    class INPUT_RECORD(ctypes.Structure):
+        _fields_ = [
+            ("EventType", wintypes.WORD),
+            ("Event", KEY_EVENT_RECORD),
+        ]
+
+    # Win32 bindings are resolved once at import instead of on every key
+    _KERNEL32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _USER32 = ctypes.WinDLL("user32", use_last_error=True)
+
+    _GetStdHandle = _KERNEL32.GetStdHandle
+    _GetStdHandle.argtypes = [wintypes.DWORD]
+    _GetStdHandle.restype = wintypes.HANDLE
+
+    _GetConsoleMode = _KERNEL32.GetConsoleMode
+    _GetConsoleMode.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
+    _GetConsoleMode.restype = wintypes.BOOL
+
+    _SetConsoleMode = _KERNEL32.SetConsoleMode
+    _SetConsoleMode.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _SetConsoleMode.restype = wintypes.BOOL
+
+    _GetNumberOfConsoleInputEvents = _KERNEL32.GetNumberOfConsoleInputEvents
+    _GetNumberOfConsoleInputEvents.argtypes = [
+        wintypes.HANDLE,
+        ctypes.POINTER(wintypes.DWORD),
+    ]
+    _GetNumberOfConsoleInputEvents.restype = wintypes.BOOL
+
+    _ReadConsoleInputW = _KERNEL32.ReadConsoleInputW
+    _ReadConsoleInputW.argtypes = [
+        wintypes.HANDLE,
+        ctypes.POINTER(INPUT_RECORD),
+        wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD),
+    ]
+    _ReadConsoleInputW.restype = wintypes.BOOL
+
+    _FlushConsoleInputBuffer = _KERNEL32.FlushConsoleInputBuffer
+    _FlushConsoleInputBuffer.argtypes = [wintypes.HANDLE]
+    _FlushConsoleInputBuffer.restype = wintypes.BOOL
+
+    _WaitForSingleObject = _KERNEL32.WaitForSingleObject
+    _WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _WaitForSingleObject.restype = wintypes.DWORD
+
+    _GetAsyncKeyState = _USER32.GetAsyncKeyState
+    _GetAsyncKeyState.argtypes = [ctypes.c_int]
+    _GetAsyncKeyState.restype = wintypes.SHORT
+
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+STD_INPUT_HANDLE = -10
+
+# Max console input records drained per ReadConsoleInputW call
+_RECORD_BATCH = 64
+
+# Console input record / mode flags
+KEY_EVENT = 0x0001
+ENABLE_PROCESSED_INPUT = 0x0001
+ENABLE_VIRTUAL_TERMINAL_INPUT = 0x0200
+LEFT_CTRL_PRESSED = 0x0008
+RIGHT_CTRL_PRESSED = 0x0004
+SHIFT_PRESSED = 0x0010
+
+# WaitForSingleObject constants
+INFINITE = 0xFFFFFFFF
+WAIT_OBJECT_0 = 0x00000000
+WAIT_TIMEOUT = 0x00000102
+
+
+# Virtual-key code -> key, without and with Ctrl held
+_VK_PLAIN = {
+    0x26: Keys.UP,
+    0x28: Keys.DOWN,
+    0x25: Keys.LEFT,
+    0x27: Keys.RIGHT,
+    0x24: Keys.HOME,
+    0x23: Keys.END,
+    0x2E: Keys.DELETE,
+    0x2D: Keys.INSERT,
+    0x21: Keys.PAGE_UP,
+    0x22: Keys.PAGE_DOWN,
+}
+_VK_CTRL = {
+    **_VK_PLAIN,
+    0x26: Keys.CTRL_UP,
+    0x28: Keys.CTRL_DOWN,
+    0x25: Keys.CTRL_LEFT,
+    0x27: Keys.CTRL_RIGHT,
+}
+
+# VK codes that never take the plain-character fast path (Enter + _VK_PLAIN)
+_SPECIAL_VKS = frozenset((0x0D, *_VK_PLAIN))
+
+# (ctrl_pressed, shift_pressed) -> Enter variant
+_ENTER_TABLE = {
+    (False, False): "\r",
+    (False, True): Keys.SHIFT_ENTER,
+    (True, False): Keys.CTRL_ENTER,
+    (True, True): Keys.CTRL_SHIFT_ENTER,
+}
+
+
+# ANSI escape sequence tables, shared by the VT and msvcrt readers
+_CSI_FINAL = {
+    "A": Keys.UP,
+    "B": Keys.DOWN,
+    "C": Keys.RIGHT,
+    "D": Keys.LEFT,
+    "H": Keys.HOME,
+    "F": Keys.END,
+}
+_CSI_TILDE = {
+    "1": Keys.HOME,
+    "3": Keys.DELETE,
+    "4": Keys.END,
+    "5": Keys.PAGE_UP,
+    "6": Keys.PAGE_DOWN,
+}
+_CSI_15 = {
+    "A": Keys.CTRL_UP,
+    "B": Keys.CTRL_DOWN,
+    "C": Keys.CTRL_RIGHT,
+    "D": Keys.CTRL_LEFT,
+}
+_SS3_FINAL = {
+    "A": Keys.UP,
+    "B": Keys.DOWN,
+    "C": Keys.RIGHT,
+    "D": Keys.LEFT,
+}
+
+
+def _parse_csi(read_next: Callable[[], str]) -> str:
+    """Parse a CSI sequence after ESC [ and return its canonical key."""
+    char = read_next()
+    if not char:
+        return "\x1b["
+
+    key = _CSI_FINAL.get(char)
+    if key is not None:
+        return key
+    if not char.isdigit():
+        return "\x1b[" + char
+
+    params = char
+    while True:
+        char = read_next()
+        if not char:
+            break
+        params += char
+        if char.isalpha() or char == "~":
+            break
+
+    if char == "~":
+        key = _CSI_TILDE.get(params[:-1])
+    elif params.startswith("1;5"):
+        key = _CSI_15.get(char)
+    return key or "\x1b[" + params
+
+
+def _parse_escape(read_next: Callable[[], str]) -> str:
+    """Parse the rest of an escape sequence after ESC using read_next()."""
+    char = read_next()
+    if not char:
+        return "\x1b"
+    if char == "[":
+        return _parse_csi(read_next)
+    if char == "O":
+        char = read_next()
+        return _SS3_FINAL.get(char) or "\x1bO" + char
+    return "\x1b" + char
+
+
+def _ms_remaining(deadline: Optional[float]) -> int:
+    """Milliseconds left until a time.monotonic() deadline (INFINITE if None)."""
+    if deadline is None:
+        return INFINITE
+    return max(0, int((deadline - time.monotonic()) * 1000))
+
+
+def _paste_text(key: str) -> str:
+    """Map a buffered key back to the text read_all_pending would produce."""
+    if key in ("\r", Keys.SHIFT_ENTER, Keys.CTRL_ENTER, Keys.CTRL_SHIFT_ENTER):
+        return "\n"
+    if len(key) == 1 and (key >= " " or key == "\n"):
+        return key
+    return ""
 
 
 class WindowsKeyBuffer:
     """Windows-specific keyboard input handler with IME support."""
 
+    _ENTER_KEYS = frozenset(
+        (
+            "\r",
+            "\n",
+            Keys.ENTER,
+            Keys.NEWLINE,
+            Keys.SHIFT_ENTER,
+            Keys.CTRL_ENTER,
+            Keys.ALT_ENTER,
+            Keys.CTRL_SHIFT_ENTER,
+        )
+    )
+    _BACKSPACE_KEYS = frozenset((Keys.BACKSPACE, Keys.BACKSPACE_WIN, Keys.CTRL_H))
+    _DELETE_KEYS = frozenset((Keys.WIN_DELETE, Keys.DELETE))
+
     def __init__(self):
-        self._last_key_time = 0
-        self._paste_threshold = 0.02
-        self._paste_buffer = []
+        self._last_key_ns = 0
+        self._paste_threshold_ns = 20_000_000  # 20ms between keys
+        self._paste_buffer = deque()
         self._is_pasting = False
         self._use_readconsole = False
         self._handle = None
         self._old_mode = None
         self._vt_input_mode = False
+        self._pending_high = None
+        self._read_impl = self._read_getwch_fallback
+        self._records = None
+        self._num_events = None
+        self._num_read = None
+        self._num_events_ref = None
+        self._num_read_ref = None
 
     def __enter__(self):
         """Initialize console for raw input with IME support."""
@@ -144,19 +269,19 @@ class WindowsKeyBuffer:
             return self
 
         try:
-            import ctypes
-            from ctypes import wintypes
-
-            kernel32 = ctypes.windll.kernel32
+            self._handle = _GetStdHandle(STD_INPUT_HANDLE)
+            if not self._handle or self._handle == INVALID_HANDLE_VALUE:
+                raise OSError("No console input handle")
 
-            STD_INPUT_HANDLE = -10
-            self._handle = kernel32.GetStdHandle(STD_INPUT_HANDLE)
+            # Scratch buffers reused by every read on the hot path
+            self._records = (INPUT_RECORD * _RECORD_BATCH)()
+            self._num_events = wintypes.DWORD()
+            self._num_read = wintypes.DWORD()
+            self._num_events_ref = ctypes.byref(self._num_events)
+            self._num_read_ref = ctypes.byref(self._num_read)
 
             self._old_mode = wintypes.DWORD()
-            kernel32.GetConsoleMode(self._handle, ctypes.byref(self._old_mode))
-
-            ENABLE_PROCESSED_INPUT = 0x0001
-            ENABLE_VIRTUAL_TERMINAL_INPUT = 0x0200
+            _GetConsoleMode(self._handle, ctypes.byref(self._old_mode))
 
             self._vt_input_mode = bool(
                 self._old_mode.value & ENABLE_VIRTUAL_TERMINAL_INPUT
@@ -166,22 +291,25 @@ class WindowsKeyBuffer:
             if self._vt_input_mode:
                 new_mode |= ENABLE_VIRTUAL_TERMINAL_INPUT
 
-            kernel32.SetConsoleMode(self._handle, new_mode)
+            _SetConsoleMode(self._handle, new_mode)
             self._use_readconsole = True
         except Exception:
             self._use_readconsole = False
             self._vt_input_mode = False
 
+        # Pick the reader once instead of re-checking on every key
+        if self._use_readconsole:
+            self._read_impl = self._read_console_char
+        else:
+            self._read_impl = self._read_getwch_fallback
+
         return self
 
     def __exit__(self, *args):
         """Restore console mode."""
         if self._use_readconsole and self._handle and self._old_mode:
             try:
-                import ctypes
-
-                kernel32 = ctypes.windll.kernel32
-                kernel32.SetConsoleMode(self._handle, self._old_mode)
+                _SetConsoleMode(self._handle, self._old_mode)
             except Exception:
                 pass
 
@@ -189,37 +317,30 @@ class WindowsKeyBuffer:
         """Get the number of events waiting in the console input buffer."""
         if not self._use_readconsole or self._handle is None:
             return 0
+        # Keys already drained by a batched read are still "pending"
+        buffered = len(self._paste_buffer)
         try:
-            import ctypes
-            from ctypes import wintypes
-
-            kernel32 = ctypes.windll.kernel32
-            num_events = wintypes.DWORD()
-            if kernel32.GetNumberOfConsoleInputEvents(
-                self._handle, ctypes.byref(num_events)
-            ):
-                return num_events.value
+            if _GetNumberOfConsoleInputEvents(self._handle, self._num_events_ref):
+                return buffered + self._num_events.value
         except Exception:
             pass
-        return 0
+        return buffered
 
     def flush_console_input(self) -> None:
         """Flush the console input buffer using FlushConsoleInputBuffer Win32 API."""
+        self._paste_buffer.clear()
         if not self._use_readconsole or self._handle is None:
             # Fallback: drain any pending characters via msvcrt.
             # Some terminals don't support FlushConsoleInputBuffer reliably, but
             # still queue pasted characters for msvcrt.getwch().
             try:
-                while IS_WINDOWS and msvcrt.kbhit():
-                    msvcrt.getwch()
+                while IS_WINDOWS and _kbhit():
+                    _getwch()
             except Exception:
                 pass
             return
         try:
-            import ctypes
-
-            kernel32 = ctypes.windll.kernel32
-            kernel32.FlushConsoleInputBuffer(self._handle)
+            _FlushConsoleInputBuffer(self._handle)
         except Exception:
             pass
 
@@ -234,14 +355,11 @@ class WindowsKeyBuffer:
             True if Ctrl and V are both pressed
         """
         try:
-            import ctypes
-
-            user32 = ctypes.windll.user32
             VK_CONTROL = 0x11
             VK_V = 0x56
             # High bit (0x8000) means key is currently pressed
-            ctrl_pressed = bool(user32.GetAsyncKeyState(VK_CONTROL) & 0x8000)
-            v_pressed = bool(user32.GetAsyncKeyState(VK_V) & 0x8000)
+            ctrl_pressed = bool(_GetAsyncKeyState(VK_CONTROL) & 0x8000)
+            v_pressed = bool(_GetAsyncKeyState(VK_V) & 0x8000)
             return ctrl_pressed and v_pressed
         except Exception:
             return False
@@ -256,319 +374,205 @@ class WindowsKeyBuffer:
             return ""
 
         try:
-            import ctypes
-            from ctypes import wintypes
-
-            kernel32 = ctypes.windll.kernel32
-
-            # Define structures
-            class KEY_EVENT_RECORD(ctypes.Structure):
-                _fields_ = [
-                    ("bKeyDown", wintypes.BOOL),
-                    ("wRepeatCount", wintypes.WORD),
-                    ("wVirtualKeyCode", wintypes.WORD),
-                    ("wVirtualScanCode", wintypes.WORD),
-                    ("uChar", wintypes.WCHAR),
-                    ("dwControlKeyState", wintypes.DWORD),
-                ]
-
-            class INPUT_RECORD(ctypes.Structure):
-                _fields_ = [
-                    ("EventType", wintypes.WORD),
-                    ("Event", KEY_EVENT_RECORD),
-                ]
-
-            chars = []
+            # Keys already pulled in by a batched read come first
+            chars = [_paste_text(key) for key in self._paste_buffer]
+            self._paste_buffer.clear()
+
+            records = self._records
+            num_events = self._num_events
+            num_read = self._num_read
+            num_events_ref = self._num_events_ref
+            num_read_ref = self._num_read_ref
             max_reads = 50000  # Safety limit
 
             for _ in range(max_reads):
                 # Check if more events
-                num_events = wintypes.DWORD()
-                if not kernel32.GetNumberOfConsoleInputEvents(
-                    self._handle, ctypes.byref(num_events)
-                ):
+                if not _GetNumberOfConsoleInputEvents(self._handle, num_events_ref):
                     break
                 if num_events.value == 0:
                     break
 
-                # Read one event
-                record = INPUT_RECORD()
-                num_read = wintypes.DWORD()
-                if not kernel32.ReadConsoleInputW(
-                    self._handle, ctypes.byref(record), 1, ctypes.byref(num_read)
+                # Drain up to a full batch of events in one call
+                if not _ReadConsoleInputW(
+                    self._handle,
+                    records,
+                    min(num_events.value, _RECORD_BATCH),
+                    num_read_ref,
                 ):
                     break
                 if num_read.value == 0:
                     break
 
-                # Only process key down events
-                if record.EventType == 0x0001 and record.Event.bKeyDown:
-                    char = record.Event.uChar
-                    if char:
-                        code = ord(char)
-                        # Include printable chars and newlines
-                        if code >= 32 or code == 10 or code == 13:
-                            if code == 13:
-                                chars.append("\n")
-                            else:
-                                chars.append(char)
+                for i in range(num_read.value):
+                    record = records[i]
+                    # Only process key down events
+                    if record.EventType == KEY_EVENT and record.Event.bKeyDown:
+                        char = self._decode_code_unit(record.Event.uChar)
+                        if char:
+                            code = ord(char)
+                            # Include printable chars and newlines
+                            if code >= 32 or code == 10 or code == 13:
+                                if code == 13:
+                                    chars.append("\n")
+                                else:
+                                    chars.append(char)
 
             return "".join(chars)
         except Exception:
             return ""
 
-    def _read_ansi_sequence_from_console_vt(
-        self,
-        kernel32,
-        INPUT_RECORD,
-        KEY_EVENT_RECORD,
-        timeout: Optional[float],
-        start_time: float,
-    ) -> str:
-        """Read an ANSI escape sequence from console input in VT Input mode."""
-        import ctypes
-        from ctypes import wintypes
-
-        seq = "\x1b"
+    def getch_batch(self, max_chars: int = 4096) -> str:
+        """
+        Read up to max_chars of pasted text in a single call.
 
-        def read_next_char(max_wait: float = 0.1) -> str:
-            wait_start = time.time()
-            while (time.time() - wait_start) < max_wait:
-                num_events = wintypes.DWORD()
-                if kernel32.GetNumberOfConsoleInputEvents(
-                    self._handle, ctypes.byref(num_events)
-                ):
-                    if num_events.value > 0:
-                        record = INPUT_RECORD()
-                        num_read = wintypes.DWORD()
-                        if kernel32.ReadConsoleInputW(
-                            self._handle,
-                            ctypes.byref(record),
-                            1,
-                            ctypes.byref(num_read),
-                        ):
-                            if (
-                                num_read.value > 0
-                                and record.EventType == 0x0001
-                                and record.Event.bKeyDown
-                            ):
-                                char = record.Event.uChar
-                                if char and char != "\x00":
-                                    return char
-                time.sleep(0.001)
+        Only active while is_pasting is set. Queued keys are served first,
+        then the console is drained in _RECORD_BATCH chunks. Stops at the
+        first non-text key and leaves it queued for getch().
+        """
+        if not self._is_pasting or not self._use_readconsole:
             return ""
 
-        char2 = read_next_char()
-        if not char2:
-            return seq
-
-        seq += char2
-
-        if char2 == "[":
-            char3 = read_next_char()
-            if not char3:
-                return seq
-            seq += char3
-
-            if char3 == "A":
-                return Keys.UP
-            elif char3 == "B":
-                return Keys.DOWN
-            elif char3 == "C":
-                return Keys.RIGHT
-            elif char3 == "D":
-                return Keys.LEFT
-            elif char3 == "H":
-                return Keys.HOME
-            elif char3 == "F":
-                return Keys.END
-            elif char3.isdigit():
-                while True:
-                    next_c = read_next_char()
-                    if not next_c:
-                        break
-                    seq += next_c
-                    if next_c.isalpha() or next_c == "~":
-                        break
-
-                params = seq[2:]
-                if params == "3~":
-                    return Keys.DELETE
-                elif params == "1~":
-                    return Keys.HOME
-                elif params == "4~":
-                    return Keys.END
-                elif params == "5~":
-                    return Keys.PAGE_UP
-                elif params == "6~":
-                    return Keys.PAGE_DOWN
-                elif params.startswith("1;5"):
-                    if params.endswith("A"):
-                        return Keys.CTRL_UP
-                    elif params.endswith("B"):
-                        return Keys.CTRL_DOWN
-                    elif params.endswith("C"):
-                        return Keys.CTRL_RIGHT
-                    elif params.endswith("D"):
-                        return Keys.CTRL_LEFT
-
-        elif char2 == "O":
-            char3 = read_next_char()
-            if char3:
-                seq += char3
-                if char3 == "A":
-                    return Keys.UP
-                elif char3 == "B":
-                    return Keys.DOWN
-                elif char3 == "C":
-                    return Keys.RIGHT
-                elif char3 == "D":
-                    return Keys.LEFT
-
-        return seq
+        chars = []
+        while len(chars) < max_chars:
+            key = self._next_console_key(0)
+            if not key:
+                break
+            text = _paste_text(key)
+            if not text:
+                self._paste_buffer.appendleft(key)
+                break
+            chars.append(text)
 
-    def _read_console_char(self, timeout: Optional[float] = None) -> str:
-        """Read a character using ReadConsoleW (supports IME)."""
-        try:
-            import ctypes
-            from ctypes import wintypes
-        except ImportError:
-            return ""
+        return "".join(chars)
 
-        try:
-            kernel32 = ctypes.windll.kernel32
-        except (AttributeError, OSError):
-            return ""
+    def _read_ansi_sequence_from_console_vt(self) -> str:
+        """Read an ANSI escape sequence from console input in VT Input mode."""
 
-        LEFT_CTRL_PRESSED = 0x0008
-        RIGHT_CTRL_PRESSED = 0x0004
-        SHIFT_PRESSED = 0x0010
+        def read_next_char(max_wait: float = 0.1) -> str:
+            return self._next_console_key(max_wait)
 
-        if self._handle is None or self._handle == -1:
-            return ""
+        return _parse_escape(read_next_char)
 
-        try:
+    def _decode_code_unit(self, code_unit: int) -> str:
+        """
+        Decode one UTF-16 code unit from a key event.
 
-            class KEY_EVENT_RECORD(ctypes.Structure):
-                _fields_ = [
-                    ("bKeyDown", wintypes.BOOL),
-                    ("wRepeatCount", wintypes.WORD),
-                    ("wVirtualKeyCode", wintypes.WORD),
-                    ("wVirtualScanCode", wintypes.WORD),
-                    ("uChar", wintypes.WCHAR),
-                    ("dwControlKeyState", wintypes.DWORD),
-                ]
-
-            class INPUT_RECORD(ctypes.Structure):
-                _fields_ = [
-                    ("EventType", wintypes.WORD),
-                    ("Event", KEY_EVENT_RECORD),
-                ]
-
-        except (TypeError, AttributeError):
+        A high surrogate is held back ('' is returned) until the matching
+        low surrogate arrives, so characters outside the BMP come out as
+        a single str instead of two broken halves.
+        """
+        if 0xD800 <= code_unit <= 0xDBFF:
+            self._pending_high = code_unit
             return ""
+        high = self._pending_high
+        self._pending_high = None
+        if high is not None and 0xDC00 <= code_unit <= 0xDFFF:
+            return chr(0x10000 + ((high - 0xD800) << 10) + (code_unit - 0xDC00))
+        return chr(code_unit) if code_unit else ""
+
+    def _translate_key_event(self, event) -> str:
+        """Translate a key-down KEY_EVENT_RECORD into a key string ('' to skip)."""
+        vk = event.wVirtualKeyCode
+        code_unit = event.uChar
+        ctrl_state = event.dwControlKeyState
+        ctrl_pressed = bool(ctrl_state & (LEFT_CTRL_PRESSED | RIGHT_CTRL_PRESSED))
+
+        # Fast path: plain printable ASCII needs no VK translation
+        if 0x20 <= code_unit <= 0x7E and not ctrl_pressed and vk not in _SPECIAL_VKS:
+            self._pending_high = None
+            return chr(code_unit)
+
+        char = self._decode_code_unit(code_unit)
+        shift_pressed = bool(ctrl_state & SHIFT_PRESSED)
+
+        # Handle Enter key with modifiers
+        if vk == 0x0D:
+            return _ENTER_TABLE[(ctrl_pressed, shift_pressed)]
+
+        # Handle special keys via VK codes
+        key = (_VK_CTRL if ctrl_pressed else _VK_PLAIN).get(vk)
+        if key is not None:
+            return key
+
+        # Ctrl+Letter handler via VK codes
+        if ctrl_pressed and 0x41 <= vk <= 0x5A:
+            return chr(vk - 0x40)
+
+        # Regular character
+        return char
 
-        start_time = time.time()
-        max_iterations = 100000
-        iterations = 0
+    def _next_console_key(self, timeout: Optional[float] = None) -> str:
+        """
+        Return the next translated key from the console input queue.
 
-        while iterations < max_iterations:
-            iterations += 1
+        Reads up to _RECORD_BATCH records per ReadConsoleInputW call and
+        queues the surplus keys in _paste_buffer, so pasted text and held
+        keys are served without a syscall per character.
+        """
+        if self._paste_buffer:
+            return self._paste_buffer.popleft()
 
+        if self._handle is None or self._records is None:
+            return ""
+
+        # Hot loop: keep every per-key lookup in locals
+        handle = self._handle
+        records = self._records
+        buffer = self._paste_buffer
+        translate = self._translate_key_event
+        num_events = self._num_events
+        num_read = self._num_read
+        num_events_ref = self._num_events_ref
+        num_read_ref = self._num_read_ref
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
             try:
-                num_events = wintypes.DWORD()
-                result = kernel32.GetNumberOfConsoleInputEvents(
-                    self._handle, ctypes.byref(num_events)
-                )
+                wait_ms = _ms_remaining(deadline)
 
-                if not result:
-                    time.sleep(0.01)
-                    continue
+                # Block in the kernel until the console input is signaled
+                if _WaitForSingleObject(handle, wait_ms) != WAIT_OBJECT_0:
+                    return ""
 
-                if num_events.value > 0:
-                    record = INPUT_RECORD()
-                    num_read = wintypes.DWORD()
-
-                    read_result = kernel32.ReadConsoleInputW(
-                        self._handle, ctypes.byref(record), 1, ctypes.byref(num_read)
-                    )
-
-                    if not read_result:
-                        time.sleep(0.01)
-                        continue
-
-                    if num_read.value > 0:
-                        if record.EventType == 0x0001 and record.Event.bKeyDown:
-                            vk = record.Event.wVirtualKeyCode
-                            char = record.Event.uChar
-                            ctrl_state = record.Event.dwControlKeyState
-
-                            ctrl_pressed = bool(
-                                ctrl_state & (LEFT_CTRL_PRESSED | RIGHT_CTRL_PRESSED)
-                            )
-                            shift_pressed = bool(ctrl_state & SHIFT_PRESSED)
-
-                            # Handle Enter key with modifiers
-                            if vk == 0x0D:
-                                if ctrl_pressed and shift_pressed:
-                                    return Keys.CTRL_SHIFT_ENTER
-                                elif ctrl_pressed:
-                                    return Keys.CTRL_ENTER
-                                elif shift_pressed:
-                                    return Keys.SHIFT_ENTER
-                                else:
-                                    return "\r"
-
-                            # Handle special keys via VK codes
-                            if vk == 0x26:
-                                return Keys.CTRL_UP if ctrl_pressed else Keys.UP
-                            elif vk == 0x28:
-                                return Keys.CTRL_DOWN if ctrl_pressed else Keys.DOWN
-                            elif vk == 0x25:
-                                return Keys.CTRL_LEFT if ctrl_pressed else Keys.LEFT
-                            elif vk == 0x27:
-                                return Keys.CTRL_RIGHT if ctrl_pressed else Keys.RIGHT
-                            elif vk == 0x24:
-                                return Keys.HOME
-                            elif vk == 0x23:
-                                return Keys.END
-                            elif vk == 0x2E:
-                                return Keys.DELETE
-                            elif vk == 0x2D:
-                                return Keys.INSERT
-                            elif vk == 0x21:
-                                return Keys.PAGE_UP
-                            elif vk == 0x22:
-                                return Keys.PAGE_DOWN
-
-                            # Ctrl+Letter handler via VK codes
-                            elif ctrl_pressed and 0x41 <= vk <= 0x5A:
-                                ctrl_char = chr(vk - 0x40)
-                                return ctrl_char
-
-                            # Regular character
-                            if char and char != "\x00":
-                                if char == "\x1b":
-                                    return self._read_ansi_sequence_from_console_vt(
-                                        kernel32,
-                                        INPUT_RECORD,
-                                        KEY_EVENT_RECORD,
-                                        timeout,
-                                        start_time,
-                                    )
-                                return char
-
-                if timeout is not None and (time.time() - start_time) >= timeout:
+                if not _GetNumberOfConsoleInputEvents(handle, num_events_ref):
                     return ""
 
-                time.sleep(0.01)
+                if num_events.value > 0:
+                    if not _ReadConsoleInputW(
+                        handle,
+                        records,
+                        min(num_events.value, _RECORD_BATCH),
+                        num_read_ref,
+                    ):
+                        return ""
+
+                    # Translated keys go straight onto the queue
+                    for record in records[: num_read.value]:
+                        if record.EventType == KEY_EVENT and record.Event.bKeyDown:
+                            key = translate(record.Event)
+                            if key:
+                                buffer.append(key)
+
+                    if buffer:
+                        return buffer.popleft()
+
+                # Only non-key events were consumed; wait for the next signal
+                if deadline is not None and time.monotonic() >= deadline:
+                    return ""
 
             except (OSError, ctypes.ArgumentError, ValueError):
                 return ""
             except Exception:
                 return ""
 
-        return ""
+    def _read_console_char(self, timeout: Optional[float] = None) -> str:
+        """Read a character using ReadConsoleW (supports IME)."""
+        char = self._next_console_key(timeout)
+        # Without VT input, VK codes already cover arrows etc., so ESC is
+        # just Escape and there is no sequence worth waiting for
+        if char == "\x1b" and self._vt_input_mode:
+            return self._read_ansi_sequence_from_console_vt()
+        return char
 
     def getch(self, timeout: Optional[float] = None) -> str:
         """
@@ -579,58 +583,59 @@ class WindowsKeyBuffer:
         if not IS_WINDOWS:
             return ""
 
-        # Try ReadConsoleW first for IME support
-        if self._use_readconsole:
-            try:
-                char = self._read_console_char(timeout)
-                if char:
-                    current_time = time.time()
-                    time_since_last = current_time - self._last_key_time
-                    self._is_pasting = time_since_last < self._paste_threshold
-                    self._last_key_time = current_time
-
-                    if char == "\x03":
-                        return Keys.CTRL_C
-
-                    return char
-                if timeout is not None:
-                    return ""
-            except Exception:
-                pass
+        try:
+            char = self._read_impl(timeout)
+        except Exception:
+            return ""
+        if not char:
+            return ""
+
+        now = time.monotonic_ns()
+        self._is_pasting = (now - self._last_key_ns) < self._paste_threshold_ns
+        self._last_key_ns = now
+
+        if char == "\x03":
+            return Keys.CTRL_C
+        return char
 
+    def _read_getwch_fallback(self, timeout: Optional[float] = None) -> str:
+        """Read a key via msvcrt.getwch() when ReadConsoleInputW is unavailable."""
         # Fallback to msvcrt
-        start_time = time.time()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        handle = self._handle or _GetStdHandle(STD_INPUT_HANDLE)
 
-        while True:
-            if msvcrt.kbhit():
-                break
-            if timeout is not None and (time.time() - start_time) >= timeout:
+        while not _kbhit():
+            wait_ms = _ms_remaining(deadline)
+            if wait_ms == 0:
                 return ""
-            time.sleep(0.01)
 
-        char = msvcrt.getwch()
-        current_time = time.time()
+            # Sleep in the kernel until the console input is signaled
+            result = _WaitForSingleObject(handle, wait_ms)
+            if result == WAIT_TIMEOUT:
+                return ""
+            if result != WAIT_OBJECT_0 or not _kbhit():
+                # Not waitable, or only non-character events are queued
+                time.sleep(0.01)
 
-        time_since_last = current_time - self._last_key_time
-        self._is_pasting = time_since_last < self._paste_threshold
-        self._last_key_time = current_time
+        char = _getwch()
 
         # Handle special prefix characters
         if char in ("\x00", "\xe0"):
-            if msvcrt.kbhit():
-                char2 = msvcrt.getwch()
+            if _kbhit():
+                char2 = _getwch()
                 combined = char + char2
                 return combined
             return char
 
         # Handle Enter variants
         if char == "\r":
-            time.sleep(0.001)
-            if msvcrt.kbhit():
-                peek_time = time.time()
-                next_char = msvcrt.getwch()
+            # Only Enter needs a timestamp: CR+LF within 5ms is Ctrl+Enter
+            enter_ns = time.monotonic_ns()
+            if self._wait_kbhit(1):
+                peek_ns = time.monotonic_ns()
+                next_char = _getwch()
                 if next_char == "\n":
-                    if (peek_time - current_time) < 0.005:
+                    if peek_ns - enter_ns < 5_000_000:
                         return Keys.CTRL_ENTER
                 elif next_char == "\x0a":
                     return Keys.CTRL_SHIFT_ENTER
@@ -642,76 +647,32 @@ class WindowsKeyBuffer:
 
         # Handle ANSI escape sequences
         if char == "\x1b":
-            time.sleep(0.01)
-            if msvcrt.kbhit():
-                char2 = msvcrt.getwch()
-                if char2 == "[":
-                    time.sleep(0.01)
-                    if msvcrt.kbhit():
-                        char3 = msvcrt.getwch()
-                        if char3 == "A":
-                            return Keys.UP
-                        elif char3 == "B":
-                            return Keys.DOWN
-                        elif char3 == "C":
-                            return Keys.RIGHT
-                        elif char3 == "D":
-                            return Keys.LEFT
-                        elif char3 == "H":
-                            return Keys.HOME
-                        elif char3 == "F":
-                            return Keys.END
-                        elif char3.isdigit():
-                            seq = char3
-                            while msvcrt.kbhit():
-                                next_c = msvcrt.getwch()
-                                seq += next_c
-                                if next_c.isalpha() or next_c == "~":
-                                    break
-                            if seq == "3~":
-                                return Keys.DELETE
-                            elif seq == "1~":
-                                return Keys.HOME
-                            elif seq == "4~":
-                                return Keys.END
-                            elif seq == "5~":
-                                return Keys.PAGE_UP
-                            elif seq == "6~":
-                                return Keys.PAGE_DOWN
-                            elif seq.startswith("1;5"):
-                                if seq.endswith("A"):
-                                    return Keys.CTRL_UP
-                                elif seq.endswith("B"):
-                                    return Keys.CTRL_DOWN
-                                elif seq.endswith("C"):
-                                    return Keys.CTRL_RIGHT
-                                elif seq.endswith("D"):
-                                    return Keys.CTRL_LEFT
-                            return "\x1b[" + seq
-                        return "\x1b[" + char3
-                    return "\x1b["
-                elif char2 == "O":
-                    time.sleep(0.01)
-                    if msvcrt.kbhit():
-                        char3 = msvcrt.getwch()
-                        if char3 == "A":
-                            return Keys.UP
-                        elif char3 == "B":
-                            return Keys.DOWN
-                        elif char3 == "C":
-                            return Keys.RIGHT
-                        elif char3 == "D":
-                            return Keys.LEFT
-                        return "\x1bO" + char3
-                    return "\x1bO"
-                return "\x1b" + char2
-            return "\x1b"
+
+            def read_next_char() -> str:
+                if not self._wait_kbhit(5):
+                    return ""
+                return _getwch()
+
+            return _parse_escape(read_next_char)
 
         return char
 
+    def _wait_kbhit(self, ms: int) -> bool:
+        """Wait up to ms milliseconds for msvcrt to have a character queued."""
+        if _kbhit():
+            return True
+        handle = self._handle or _GetStdHandle(STD_INPUT_HANDLE)
+        result = _WaitForSingleObject(handle, ms)
+        if result == WAIT_TIMEOUT:
+            return False
+        if result != WAIT_OBJECT_0:
+            # Handle is not waitable; fall back to a plain sleep
+            time.sleep(ms / 1000)
+        return _kbhit()
+
     def getch_nowait(self) -> str:
         """Non-blocking read. Returns empty string if no input."""
-        if IS_WINDOWS and msvcrt.kbhit():
+        if IS_WINDOWS and _kbhit():
             return self.getch(timeout=0)
         return ""
 
@@ -722,24 +683,15 @@ class WindowsKeyBuffer:
 
     def is_enter(self, key: str) -> bool:
         """Check if key is any Enter variant."""
-        return key in (
-            "\r",
-            "\n",
-            Keys.ENTER,
-            Keys.NEWLINE,
-            Keys.SHIFT_ENTER,
-            Keys.CTRL_ENTER,
-            Keys.ALT_ENTER,
-            Keys.CTRL_SHIFT_ENTER,
-        )
+        return key in self._ENTER_KEYS
 
     def is_backspace(self, key: str) -> bool:
         """Check if key is Backspace."""
-        return key in (Keys.BACKSPACE, Keys.BACKSPACE_WIN, Keys.CTRL_H)
+        return key in self._BACKSPACE_KEYS
 
     def is_delete(self, key: str) -> bool:
         """Check if key is Delete."""
-        return key == Keys.WIN_DELETE or key == Keys.DELETE
+        return key in self._DELETE_KEYS
 
     def is_printable(self, key: str) -> bool:
         """Check if key is a printable character (including CJK from IME)."""
@@ -751,6 +703,7 @@ class WindowsKeyBuffer:
 
     def flush(self) -> None:
         """Flush any pending input."""
+        self._paste_buffer.clear()
         if IS_WINDOWS:
-            while msvcrt.kbhit():
-                msvcrt.getwch()
+            while _kbhit():
+                _getwch()
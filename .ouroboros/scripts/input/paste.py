@@ -7,9 +7,13 @@ and event count detection fallback.
 
 """
 
+import os
+import re
 import sys
 import atexit
 import time
+import weakref
+from collections import deque
 from typing import Optional, Callable, Tuple
 
 # ANSI escape sequences for Bracketed Paste Mode
@@ -19,6 +23,32 @@ PASTE_START = "\x1b[200~"
 PASTE_END = "\x1b[201~"
 PASTE_START_PARTIAL = "[200~"
 PASTE_END_PARTIAL = "[201~"
+_START_SEQS = frozenset({PASTE_START, PASTE_START_PARTIAL})
+_END_SEQS = frozenset({PASTE_END, PASTE_END_PARTIAL})
+# Either full marker; group 1 is "0" for start, "1" for end
+_PASTE_MARKER_RE = re.compile(r"\x1b\[20([01])~")
+
+
+def _raw_write(data: str) -> None:
+    """
+    Write terminal control sequences to stderr in a single os.write.
+
+    Falls back to sys.stderr.write when stderr has no usable file
+    descriptor (e.g. it has been replaced by a StringIO).
+    """
+    stream = sys.stderr
+    try:
+        fd = stream.fileno()
+    except Exception:
+        stream.write(data)
+        stream.flush()
+        return
+    # Keep ordering with anything already buffered in the Python stream
+    stream.flush()
+    buf = data.encode("ascii")
+    while buf:
+        written = os.write(fd, buf)
+        buf = buf[written:]
 
 
 class BracketedPasteHandler:
@@ -36,6 +66,10 @@ class BracketedPasteHandler:
         handler.disable()
     """
 
+    # Live handlers, restored by one process-wide atexit hook
+    _instances: "weakref.WeakSet[BracketedPasteHandler]" = weakref.WeakSet()
+    _atexit_registered = False
+
     def __init__(self):
         self._enabled = False
         self._collecting = False
@@ -46,28 +80,30 @@ class BracketedPasteHandler:
         if not self._enabled:
             # Write terminal control sequences to stderr to keep stdout clean for
             # AI consumption (stdout is reserved for the final submitted text).
-            sys.stderr.write(ENABLE_BRACKETED_PASTE)
-            sys.stderr.flush()
+            _raw_write(ENABLE_BRACKETED_PASTE)
             self._enabled = True
-            atexit.register(self._cleanup)
+            BracketedPasteHandler._instances.add(self)
+            if not BracketedPasteHandler._atexit_registered:
+                atexit.register(BracketedPasteHandler._global_cleanup)
+                BracketedPasteHandler._atexit_registered = True
 
     def disable(self) -> None:
         """Disable Bracketed Paste Mode in the terminal."""
         if self._enabled:
-            sys.stderr.write(DISABLE_BRACKETED_PASTE)
-            sys.stderr.flush()
+            _raw_write(DISABLE_BRACKETED_PASTE)
             self._enabled = False
-            try:
-                atexit.unregister(self._cleanup)
-            except Exception:
-                pass
+
+    @classmethod
+    def _global_cleanup(cls) -> None:
+        """Cleanup handler for atexit, covering every live handler."""
+        for handler in list(cls._instances):
+            handler._cleanup()
 
     def _cleanup(self) -> None:
         """Cleanup handler for atexit."""
         if self._enabled:
             try:
-                sys.stderr.write(DISABLE_BRACKETED_PASTE)
-                sys.stderr.flush()
+                _raw_write(DISABLE_BRACKETED_PASTE)
             except Exception:
                 pass
 
@@ -83,11 +119,11 @@ class BracketedPasteHandler:
 
     def is_paste_start_sequence(self, sequence: str) -> bool:
         """Check if the given sequence is the paste start marker."""
-        return sequence == PASTE_START or sequence == PASTE_START_PARTIAL
+        return sequence in _START_SEQS
 
     def is_paste_end_sequence(self, sequence: str) -> bool:
         """Check if the given sequence is the paste end marker."""
-        return sequence == PASTE_END or sequence == PASTE_END_PARTIAL
+        return sequence in _END_SEQS
 
     def start_collecting(self) -> None:
         """Start collecting paste content."""
@@ -128,6 +164,20 @@ class PasteSequenceParser:
     STATE_ZERO = 4
     STATE_DIGIT = 5
 
+    # state -> {char: (next_state, action, sequence_type)}; any char not in
+    # a row aborts the sequence and flushes the buffer as regular input
+    _TRANSITIONS = {
+        STATE_NORMAL: {"\x1b": (STATE_ESC, "start", None)},
+        STATE_ESC: {"[": (STATE_BRACKET, "buffer", None)},
+        STATE_BRACKET: {"2": (STATE_TWO, "buffer", None)},
+        STATE_TWO: {"0": (STATE_ZERO, "buffer", None)},
+        STATE_ZERO: {
+            "0": (STATE_DIGIT, "buffer", "0"),
+            "1": (STATE_DIGIT, "buffer", "1"),
+        },
+        STATE_DIGIT: {"~": (STATE_NORMAL, "marker", None)},
+    }
+
     def __init__(self):
         self._state = self.STATE_NORMAL
         self._buffer = []
@@ -141,6 +191,11 @@ class PasteSequenceParser:
         self._pending = []
         return result
 
+    @property
+    def is_idle(self) -> bool:
+        """Check if the parser is outside any partial escape sequence."""
+        return self._state == self.STATE_NORMAL
+
     def reset(self) -> None:
         """Reset the parser state."""
         self._flush_buffer_to_pending()
@@ -162,85 +217,41 @@ class PasteSequenceParser:
             'char': Character(s) available in pending_chars
             'buffering': Waiting for more characters
         """
-        if self._state == self.STATE_NORMAL:
-            if char == "\x1b":
-                self._buffer = [char]
-                self._state = self.STATE_ESC
-                return "buffering"
-            else:
-                self._pending = [char]
-                return "char"
+        # Plain characters outside a sequence are the common case in a paste
+        if char != "\x1b" and self._state == self.STATE_NORMAL:
+            self._pending = [char]
+            self._sequence_type = None
+            return "char"
 
-        elif self._state == self.STATE_ESC:
-            if char == "[":
-                self._buffer.append(char)
-                self._state = self.STATE_BRACKET
-                return "buffering"
-            else:
-                self._flush_buffer_to_pending()
-                self._pending.append(char)
-                self._state = self.STATE_NORMAL
-                return "char"
-
-        elif self._state == self.STATE_BRACKET:
-            if char == "2":
-                self._buffer.append(char)
-                self._state = self.STATE_TWO
-                return "buffering"
-            else:
-                self._flush_buffer_to_pending()
-                self._pending.append(char)
-                self._state = self.STATE_NORMAL
-                return "char"
-
-        elif self._state == self.STATE_TWO:
-            if char == "0":
-                self._buffer.append(char)
-                self._state = self.STATE_ZERO
-                return "buffering"
-            else:
-                self._flush_buffer_to_pending()
-                self._pending.append(char)
-                self._state = self.STATE_NORMAL
-                return "char"
-
-        elif self._state == self.STATE_ZERO:
-            if char == "0":
-                self._buffer.append(char)
-                self._sequence_type = "0"
-                self._state = self.STATE_DIGIT
-                return "buffering"
-            elif char == "1":
-                self._buffer.append(char)
-                self._sequence_type = "1"
-                self._state = self.STATE_DIGIT
-                return "buffering"
-            else:
+        row = self._TRANSITIONS.get(self._state)
+        step = row.get(char) if row is not None else None
+
+        if step is None:
+            if self._state != self.STATE_NORMAL and row is not None:
                 self._flush_buffer_to_pending()
                 self._pending.append(char)
-                self._state = self.STATE_NORMAL
-                return "char"
-
-        elif self._state == self.STATE_DIGIT:
-            if char == "~":
-                self._buffer = []
-                self._state = self.STATE_NORMAL
-                if self._sequence_type == "0":
-                    self._sequence_type = None
-                    return "paste-start"
-                else:
-                    self._sequence_type = None
-                    return "paste-end"
             else:
-                self._flush_buffer_to_pending()
-                self._pending.append(char)
-                self._state = self.STATE_NORMAL
-                self._sequence_type = None
-                return "char"
+                self._pending = [char]
+            self._state = self.STATE_NORMAL
+            self._sequence_type = None
+            return "char"
 
-        self._pending = [char]
-        self._state = self.STATE_NORMAL
-        return "char"
+        next_state, action, sequence_type = step
+        self._state = next_state
+
+        if action == "marker":
+            self._buffer = []
+            result = "paste-start" if self._sequence_type == "0" else "paste-end"
+            self._sequence_type = None
+            return result
+
+        if action == "start":
+            self._buffer = [char]
+        else:
+            self._buffer.append(char)
+        if sequence_type is not None:
+            self._sequence_type = sequence_type
+        return "buffering"
 
     def timeout(self) -> str:
         """Called when there's a timeout waiting for more characters."""
@@ -281,7 +292,7 @@ class PasteDetector:
         self._handler = BracketedPasteHandler()
         self._parser = PasteSequenceParser()
         self._timeout = timeout
-        self._pending_keys = []
+        self._pending_keys: deque = deque()
 
     def enable(self) -> None:
         """Enable Bracketed Paste Mode."""
@@ -312,7 +323,7 @@ class PasteDetector:
             - For paste: (pasted_text, True)
         """
         if self._pending_keys:
-            key = self._pending_keys.pop(0)
+            key = self._pending_keys.popleft()
             return (key, False)
 
         if timeout is not None:
@@ -336,9 +347,10 @@ class PasteDetector:
 
         # Check if this is a complete escape sequence
         if len(char) > 1 and char.startswith("\x1b"):
-            if char == "\x1b[200~":
+            # Only the full markers can start with ESC here
+            if char in _START_SEQS:
                 return self._collect_paste(getch_func)
-            elif char == "\x1b[201~":
+            elif char in _END_SEQS:
                 return self.read(getch_func, timeout)
             else:
                 return (char, False)
@@ -347,16 +359,16 @@ class PasteDetector:
 
     def _continue_parsing(self, getch_func: Callable) -> Tuple[str, bool]:
         """Continue parsing when buffering for escape sequence."""
-        start_time = time.time()
-        esc_timeout = 0.05
+        # The escape window is short, so it is checked on every pass
+        deadline = time.monotonic() + 0.05
 
         while True:
-            if time.time() - start_time > esc_timeout:
+            if time.monotonic() > deadline:
                 result = self._parser.timeout()
                 if result == "char":
                     pending = self._parser.pending_chars
                     if len(pending) > 1:
-                        self._pending_keys.extend(list(pending[1:]))
+                        self._pending_keys.extend(pending[1:])
                         return (pending[0], False)
                     elif len(pending) == 1:
                         return (pending, False)
@@ -373,7 +385,7 @@ class PasteDetector:
             elif result == "char":
                 pending = self._parser.pending_chars
                 if len(pending) > 1:
-                    self._pending_keys.extend(list(pending[1:]))
+                    self._pending_keys.extend(pending[1:])
                     return (pending[0], False)
                 elif len(pending) == 1:
                     return (pending, False)
@@ -385,30 +397,91 @@ class PasteDetector:
     def _collect_paste(self, getch_func: Callable) -> Tuple[str, bool]:
         """Collect paste content until paste end marker."""
         content = []
-        start_time = time.time()
+        deadline = time.monotonic() + self._timeout
         end_parser = PasteSequenceParser()
+        reads = 0
 
         while True:
-            if time.time() - start_time > self._timeout:
+            chunk = getch_func(timeout=0.1)
+            if not chunk:
+                # Idle reads already waited; check the budget every time
+                if time.monotonic() > deadline:
+                    break
+                continue
+
+            if self._scan_paste_chunk(chunk, end_parser, content):
                 break
 
-            char = getch_func(timeout=0.1)
-            if not char:
-                continue
+            # While data is flowing, the clock is only sampled every 64 reads
+            reads += 1
+            if not reads & 63 and time.monotonic() > deadline:
+                break
 
-            result = end_parser.feed(char)
+        return ("".join(content), True)
 
-            if result == "paste-end":
+    def _scan_paste_chunk(
+        self, chunk: str, end_parser: "PasteSequenceParser", content: list
+    ) -> bool:
+        """
+        Append a chunk of paste input to content, stopping at the end marker.
+
+        Complete markers are located with one compiled regex search per
+        marker; only a marker split across reads goes through the
+        per-character parser. Anything read past the end marker is queued
+        as regular keys.
+
+        Returns:
+            True if the paste end marker was found
+        """
+        pos = 0
+        size = len(chunk)
+
+        # Finish a marker left partial by the previous read
+        while pos < size and not end_parser.is_idle:
+            if chunk[pos] == "\x1b":
+                # A new ESC abandons the partial marker; rescan from here
+                end_parser.timeout()
+                content.append(end_parser.pending_chars)
                 break
+            result = end_parser.feed(chunk[pos])
+            pos += 1
+            if result == "paste-end":
+                self._pending_keys.extend(chunk[pos:])
+                return True
             elif result == "paste-start":
-                content.append("\x1b[200~")
+                content.append(PASTE_START)
             elif result == "char":
-                pending = end_parser.pending_chars
-                content.append(pending)
-            elif result == "buffering":
-                continue
+                content.append(end_parser.pending_chars)
 
-        return ("".join(content), True)
+        search = _PASTE_MARKER_RE.search
+        while pos < size:
+            match = search(chunk, pos)
+            if match is None:
+                break
+            start = match.start()
+            if start > pos:
+                content.append(chunk[pos:start])
+            pos = match.end()
+            if match.group(1) == "1":
+                self._pending_keys.extend(chunk[pos:])
+                return True
+            content.append(PASTE_START)
+
+        if pos >= size:
+            return False
+
+        # Hold back a trailing marker prefix until the next read completes it
+        tail = chunk.rfind("\x1b", max(pos, size - len(PASTE_END) + 1))
+        if tail != -1 and (
+            PASTE_END.startswith(chunk[tail:]) or PASTE_START.startswith(chunk[tail:])
+        ):
+            if tail > pos:
+                content.append(chunk[pos:tail])
+            for char in chunk[tail:]:
+                end_parser.feed(char)
+        else:
+            content.append(chunk[pos:] if pos else chunk)
+        return False
 
 
 # Global singleton
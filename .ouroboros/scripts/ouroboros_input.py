@@ -26,12 +26,13 @@ Dependencies: Python 3.9+ standard library only (msvcrt/tty/termios)
 
 """
 
+import io
 import sys
 import os
-import argparse
 import re
 import time
 import atexit
+from itertools import islice
 
 # Version
 VERSION = "3.1.0"
@@ -58,6 +59,35 @@ THEME = {
     "reset": "\033[0m",
 }
 
+# Fallback-mode UI strings, formatted from THEME by _build_fallback_strings()
+_FALLBACK_BANNER = ""
+_FALLBACK_PROMPT = ""
+_FALLBACK_MULTILINE_HINT = ""
+
+
+def _build_fallback_strings() -> None:
+    """
+    Format the fallback-mode banner, prompt and hint from THEME.
+
+    Runs at import and again from main() once --no-color has blanked THEME.
+    """
+    global _FALLBACK_BANNER, _FALLBACK_PROMPT, _FALLBACK_MULTILINE_HINT
+    _FALLBACK_BANNER = (
+        "\n"
+        f"{THEME['border']}╔{'═' * 50}╗{THEME['reset']}\n"
+        f"{THEME['border']}║{THEME['reset']}  [*]  Ouroboros - Awaiting Command"
+        f"{' ' * 15}{THEME['border']}║{THEME['reset']}\n"
+        f"{THEME['border']}╚{'═' * 50}╝{THEME['reset']}\n"
+        "\n"
+    )
+    _FALLBACK_PROMPT = f"{THEME['prompt']}>{THEME['reset']} "
+    _FALLBACK_MULTILINE_HINT = (
+        f"  {THEME['info']}Multi-line mode. Type >>> to submit:{THEME['reset']}\n"
+    )
+
+
+_build_fallback_strings()
+
 
 # =============================================================================
 # UTILITY FUNCTIONS
@@ -148,6 +178,11 @@ def graceful_exit(exit_code: int = 130) -> None:
 # MENU OPTION PARSING
 # =============================================================================
 
+# Compiled once; matched against every line of a menu header
+_YES_NO_RE = re.compile(r"\[y/n\]", re.IGNORECASE)
+_NUMBERED_OPTION_RE = re.compile(r"^\s*(\d+)[.)\]]\s*(.+)$")
+_MENU_OPTION_RE = re.compile(r"^\s*[\[\(]?(\d+)[\.\)\]:\s]\s*(.+)$")
+
 
 def detect_yes_no(prompt: str) -> bool:
     """
@@ -155,7 +190,7 @@ def detect_yes_no(prompt: str) -> bool:
 
 
     """
-    return bool(re.search(r"\[y/n\]", prompt, re.IGNORECASE))
+    return _YES_NO_RE.search(prompt) is not None
 
 
 def parse_numbered_options(text: str) -> list:
@@ -169,10 +204,10 @@ def parse_numbered_options(text: str) -> list:
 
     """
     options = []
-    pattern = r"^\s*(\d+)[.)\]]\s*(.+)$"
+    match_option = _NUMBERED_OPTION_RE.match
 
     for line in text.split("\n"):
-        match = re.match(pattern, line.strip())
+        match = match_option(line.strip())
         if match:
             options.append(match.group(2).strip())
 
@@ -211,7 +246,7 @@ def parse_menu_options(header: str, prompt: str = "") -> tuple:
             continue
 
         # Try to match numbered option patterns
-        match = re.match(r"^\s*[\[\(]?(\d+)[\.\)\]:\s]\s*(.+)$", line)
+        match = _MENU_OPTION_RE.match(line)
 
         if match:
             options.append(match.group(2).strip())
@@ -259,29 +294,19 @@ def get_fallback_input(show_ui: bool = True) -> str:
     """
     Fallback input using standard input() when TUI modules not available.
     """
-    if show_ui:
-        writeln()
-        writeln(f"{THEME['border']}╔{'═' * 50}╗{THEME['reset']}")
-        writeln(
-            f"{THEME['border']}║{THEME['reset']}  [*]  Ouroboros - Awaiting Command{' ' * 15}{THEME['border']}║{THEME['reset']}"
-        )
-        writeln(f"{THEME['border']}╚{'═' * 50}╝{THEME['reset']}")
-        writeln()
-
-    write(f"{THEME['prompt']}>{THEME['reset']} ")
+    # Banner and prompt go out in a single write
+    write(_FALLBACK_BANNER + _FALLBACK_PROMPT if show_ui else _FALLBACK_PROMPT)
 
     try:
         line = input()
-        if line.strip() == "<<<":
+        if "<<<" in line and line.strip() == "<<<":
             # Multiline mode
-            writeln(
-                f"  {THEME['info']}Multi-line mode. Type >>> to submit:{THEME['reset']}"
-            )
+            write(_FALLBACK_MULTILINE_HINT)
             lines = []
             while True:
                 try:
                     next_line = input("  │ ")
-                    if next_line.strip() == ">>>":
+                    if ">>>" in next_line and next_line.strip() == ">>>":
                         break
                     lines.append(next_line)
                 except EOFError:
@@ -299,17 +324,29 @@ def get_fallback_input(show_ui: bool = True) -> str:
 # TUI INTEGRATION
 # =============================================================================
 
-# Try to import TUI modules
-TUI_AVAILABLE = False
-try:
-    from tui import TUIApp, run_tui, format_output, write_output
-    from components.selection_menu import SelectionMenu
-    from input.keybuffer import KeyBuffer, Keys
-    from input.commands import prepend_instruction
+# TUI modules are imported on first interactive use, so --version, --help
+# and piped runs never load them; None until _load_tui() has run
+TUI_AVAILABLE = None
 
-    TUI_AVAILABLE = True
-except ImportError:
-    pass
+
+def _load_tui() -> bool:
+    """
+    Import the interactive TUI modules once.
+
+    Returns:
+        True if they are available, False to use the fallback input
+    """
+    global TUI_AVAILABLE, run_tui, SelectionMenu, KeyBuffer, Keys
+    if TUI_AVAILABLE is None:
+        try:
+            from tui import run_tui
+            from components.selection_menu import SelectionMenu
+            from input.keybuffer import KeyBuffer, Keys
+
+            TUI_AVAILABLE = True
+        except ImportError:
+            TUI_AVAILABLE = False
+    return TUI_AVAILABLE
 
 
 def get_tui_input(
@@ -320,7 +357,7 @@ def get_tui_input(
 
 
     """
-    if not TUI_AVAILABLE:
+    if not _load_tui():
         return get_fallback_input(show_ui=True)
 
     try:
@@ -344,7 +381,7 @@ def get_selection_input(
 
 
     """
-    if not TUI_AVAILABLE:
+    if not _load_tui():
         # Fallback to numbered selection
         writeln(title)
         for i, opt in enumerate(options):
@@ -466,7 +503,12 @@ def output_result(marker: str, content: str) -> None:
 
 
     """
-    if TUI_AVAILABLE:
+    try:
+        from tui.output import format_output
+    except ImportError:
+        format_output = None
+
+    if format_output is not None:
         # Use TUI output formatting
         formatted = format_output(content)
 
@@ -494,7 +536,13 @@ def output_result(marker: str, content: str) -> None:
             # Build a preview for display (avoid dumping huge payloads to the terminal).
             max_preview_lines = 20
             max_preview_chars = 4000
-            preview_lines = formatted.splitlines()
+            # Only the preview lines are split out, not the whole payload
+            preview_lines = [
+                line.rstrip("\r\n")
+                for line in islice(
+                    io.StringIO(formatted, newline="\n"), max_preview_lines + 1
+                )
+            ]
             truncated = False
 
             if len(preview_lines) > max_preview_lines:
@@ -564,6 +612,8 @@ def parse_args():
 
 
     """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Ouroboros Enhanced Input Handler v3",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -646,12 +696,18 @@ def main():
 
 
     """
+    # Answer --version without building the argument parser
+    if "--version" in sys.argv[1:]:
+        print(f"{os.path.basename(sys.argv[0])} {VERSION}")
+        return
+
     args = parse_args()
 
     # Update theme if colors disabled
     if args.no_color:
         for key in THEME:
             THEME[key] = ""
+        _build_fallback_strings()
 
     # Detect mode
     mode = detect_mode(args)
@@ -693,9 +749,11 @@ def main():
 
             # Map Yes/No back to y/n for compatibility
             if is_yes_no:
-                if content.lower().startswith("yes"):
+                # Lowercase only the prefix, not the whole answer
+                answer = content[:3].lower()
+                if answer.startswith("yes"):
                     content = "y"
-                elif content.lower().startswith("no"):
+                elif answer.startswith("no"):
                     content = "n"
 
         elif mode == "header":
@@ -88,6 +88,13 @@ PATTERNS = {
     },
 }
 
+# Sub-patterns applied to every matched question-menu command, compiled once
+_QUESTION_PRINT_RE = re.compile(r"print\('([^']*)'\); print\(\)")
+_OPTION_PRINT_RE = re.compile(r"print\('(\[[^\]]+\][^']*)'\)")
+_CHOICE_INPUT_RE = re.compile(r"choice = input\('([^']*)'\)")
+_FEATURE_INPUT_RE = re.compile(r"feature = input\('([^']*)'\)")
+_CONFIRM_INPUT_RE = re.compile(r"confirm = input\('([^']*)'\)")
+
 # =============================================================================
 # DETECTION FUNCTIONS
 # =============================================================================
@@ -175,10 +182,10 @@ def convert_to_enhanced(content: str) -> tuple[str, int]:
     # Format: print('question'); print(); print('[1] A'); print('[2] B'); choice = input('...')
     def replace_menu_with_question(match):
         full_match = match.group(0)
-        question_match = re.search(r"print\('([^']*)'\); print\(\)", full_match)
+        question_match = _QUESTION_PRINT_RE.search(full_match)
         question = question_match.group(1) if question_match else ""
-        print_items = re.findall(r"print\('(\[[^\]]+\][^']*)'\)", full_match)
-        prompt_match = re.search(r"choice = input\('([^']*)'\)", full_match)
+        print_items = _OPTION_PRINT_RE.findall(full_match)
+        prompt_match = _CHOICE_INPUT_RE.search(full_match)
         prompt = prompt_match.group(1) if prompt_match else "Select:"
         header = "\\n".join(print_items)
         if question:
@@ -192,10 +199,10 @@ def convert_to_enhanced(content: str) -> tuple[str, int]:
     # Type C with Question: Feature input with question
     def replace_feature_with_question(match):
         full_match = match.group(0)
-        question_match = re.search(r"print\('([^']*)'\); print\(\)", full_match)
+        question_match = _QUESTION_PRINT_RE.search(full_match)
         question = question_match.group(1) if question_match else ""
-        print_items = re.findall(r"print\('(\[[^\]]+\][^']*)'\)", full_match)
-        prompt_match = re.search(r"feature = input\('([^']*)'\)", full_match)
+        print_items = _OPTION_PRINT_RE.findall(full_match)
+        prompt_match = _FEATURE_INPUT_RE.search(full_match)
         prompt = prompt_match.group(1) if prompt_match else "Feature:"
         header = "\\n".join(print_items)
         if question:
@@ -209,10 +216,10 @@ def convert_to_enhanced(content: str) -> tuple[str, int]:
     # Type D with Question: Confirm with question
     def replace_confirm_with_question(match):
         full_match = match.group(0)
-        question_match = re.search(r"print\('([^']*)'\); print\(\)", full_match)
+        question_match = _QUESTION_PRINT_RE.search(full_match)
         question = question_match.group(1) if question_match else ""
-        print_items = re.findall(r"print\('(\[[^\]]+\][^']*)'\)", full_match)
-        prompt_match = re.search(r"confirm = input\('([^']*)'\)", full_match)
+        print_items = _OPTION_PRINT_RE.findall(full_match)
+        prompt_match = _CONFIRM_INPUT_RE.search(full_match)
         prompt = prompt_match.group(1) if prompt_match else "[y/n]:"
         header = "\\n".join(print_items)
         if question:
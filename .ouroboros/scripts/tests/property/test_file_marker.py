@@ -256,6 +256,16 @@ class TestFileMarkerRoundTrip(unittest.TestCase):
                 path, via_extract, f"Extracted path differs from original for '{path}'"
             )
 
+    def test_unicode_whitespace_trimmed_from_marked_path(self):
+        """
+        Pasted paths ending in NBSP or ideographic space are trimmed.
+
+        Browsers and CJK input methods append these; any Unicode whitespace
+        around the path or its quotes must not end up in the marker.
+        """
+        for path in ["/home/user/file.py\u00a0", "\u3000'/home/user/file.py'\u3000"]:
+            self.assertEqual("«/home/user/file.py»", create_file_marker(path))
+
 
 if __name__ == "__main__":
     unittest.main()
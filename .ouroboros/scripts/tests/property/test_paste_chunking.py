@@ -0,0 +1,148 @@
+"""
+Property Test: Paste Collection Is Independent of Read Chunking
+
+**Feature: curses-tui-frontend, Property: Chunked Paste Collection**
+**Validates: Requirements 7.1, 7.5**
+
+*For any* bracketed-paste stream split into reads of any size, collecting
+the paste SHALL yield the same content and the same keys queued after the
+end marker as feeding the stream one key at a time.
+"""
+
+import sys
+import os
+import unittest
+import random
+from typing import List, Tuple
+
+# Add scripts directory to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from tests.pbt_framework import Generator, property_test
+from input.paste import PasteDetector, PASTE_START, PASTE_END
+
+
+class ChunkedPasteGenerator(Generator[Tuple[str, List[int]]]):
+    """
+    Generate a paste stream and the read boundaries to split it at.
+
+    The paste body mixes plain text with ESC bytes, marker prefixes and
+    nested start markers, so boundaries regularly land inside a marker.
+    The stream always ends with PASTE_END followed by trailing keys.
+    """
+
+    TOKENS = [
+        "a",
+        "xyz",
+        "\n",
+        "中",
+        "~",
+        "[201~",
+        "\x1b",
+        "\x1b[",
+        "\x1b[2",
+        "\x1b[20",
+        "\x1b[201",
+        "\x1b[20x",
+        "\x1b[A",
+        PASTE_START,
+    ]
+
+    def generate(self, rng: random.Random) -> Tuple[str, List[int]]:
+        body = "".join(rng.choices(self.TOKENS, k=rng.randint(0, 30)))
+        trailing = "".join(
+            rng.choices(["q", "\r", "\x1b", "\x1b[B"], k=rng.randint(0, 4))
+        )
+        stream = body + PASTE_END + trailing
+        count = rng.randint(0, min(len(stream) - 1, 12))
+        cuts = sorted(rng.sample(range(1, len(stream)), count))
+        return stream, cuts
+
+    def shrink(self, value: Tuple[str, List[int]]) -> List[Tuple[str, List[int]]]:
+        stream, cuts = value
+        if not cuts:
+            return []
+        return [(stream, cuts[:1]), (stream, cuts[:-1])]
+
+
+def _split(stream: str, cuts: List[int]) -> List[str]:
+    """Split stream at the given offsets."""
+    bounds = [0] + cuts + [len(stream)]
+    return [stream[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def _collect(chunks: List[str]) -> Tuple[str, str]:
+    """
+    Collect a paste from a sequence of reads.
+
+    Returns:
+        Tuple of (pasted content, keys left over after the end marker),
+        where the leftover keys include both the detector's queue and any
+        reads it never consumed.
+    """
+    reads = iter(chunks)
+    detector = PasteDetector(timeout=1.0)
+    content, is_paste = detector._collect_paste(lambda timeout=None: next(reads, ""))
+    assert is_paste
+    return content, "".join(detector._pending_keys) + "".join(reads)
+
+
+class TestPasteChunking(unittest.TestCase):
+    """
+    **Feature: curses-tui-frontend, Property: Chunked Paste Collection**
+    **Validates: Requirements 7.1, 7.5**
+    """
+
+    @property_test(ChunkedPasteGenerator(), iterations=300)
+    def test_chunked_reads_match_per_key_feeding(self, value):
+        """
+        Any chunking of the stream collects the same paste as per-key reads.
+        """
+        stream, cuts = value
+
+        expected = _collect(list(stream))
+        actual = _collect(_split(stream, cuts))
+
+        self.assertEqual(expected, actual)
+
+    @property_test(ChunkedPasteGenerator(), iterations=100)
+    def test_single_read_matches_per_key_feeding(self, value):
+        """
+        Reading the whole stream at once collects the same paste as per-key reads.
+        """
+        stream, _ = value
+
+        self.assertEqual(_collect(list(stream)), _collect([stream]))
+
+    def test_keys_after_end_marker_are_queued(self):
+        """
+        Keys in the same read as the end marker are queued in order.
+        """
+        stream = "line1\nline2" + PASTE_END + "ab\x1b[A"
+
+        for chunks in ([stream], list(stream), [stream[:8], stream[8:14], stream[14:]]):
+            reads = iter(chunks)
+            detector = PasteDetector(timeout=1.0)
+            content, _ = detector._collect_paste(lambda timeout=None: next(reads, ""))
+
+            self.assertEqual("line1\nline2", content)
+            self.assertEqual(
+                "ab\x1b[A", "".join(detector._pending_keys) + "".join(reads)
+            )
+
+    def test_marker_split_across_reads(self):
+        """
+        An end marker split at every possible offset is still recognised.
+        """
+        stream = "text" + PASTE_END + "k"
+
+        for cut in range(1, len(stream)):
+            self.assertEqual(
+                ("text", "k"), _collect([stream[:cut], stream[cut:]]), f"cut={cut}"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
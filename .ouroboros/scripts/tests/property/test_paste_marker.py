@@ -318,6 +318,17 @@ class TestPasteMarkerRoundTrip(unittest.TestCase):
                 content, expanded, f"Newline pattern not preserved for: {repr(content)}"
             )
 
+    def test_paste_marker_inside_stray_file_marker_delimiters(self):
+        """
+        A paste marker between a stray « and a later » is still expanded.
+
+        File markers are expanded before paste markers, so the «...» span
+        swallows only its delimiters and the paste content is decoded.
+        """
+        text = "«‹PASTE:3›a⏎b‹/PASTE› »"
+
+        self.assertEqual("a\nb ", expand_markers(text))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,144 @@
+"""
+Unit Tests: Debounced Config Saving
+
+set() marks the config dirty and saves it once SAVE_DELAY has passed, so a
+burst of changes costs one write; flush() saves pending changes at once.
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+# Add scripts directory to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from data import config as config_module
+from data.config import ConfigManager
+
+
+class TestDebouncedSave(unittest.TestCase):
+    """ConfigManager.set() and flush() against a temporary config file."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "test.config.json")
+        self.config = ConfigManager(config_file=self.path)
+        # Count writes made after the defaults were created on load
+        self.writes = 0
+        save = self.config._save
+
+        def counting_save():
+            self.writes += 1
+            save()
+
+        self.config._save = counting_save
+
+    def tearDown(self):
+        self.config.flush()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def read_file(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @mock.patch.object(config_module, "SAVE_DELAY", 0.05)
+    def test_burst_of_sets_is_one_write(self):
+        self.config.set("theme", "dark")
+        self.config.set("compress_threshold", 20)
+        self.config.set("auto_multiline", False)
+        self.assertEqual(0, self.writes)
+
+        # Wait for the debounce timer to fire
+        timer = self.config._save_timer
+        timer.join(5)
+
+        self.assertEqual(1, self.writes)
+        saved = self.read_file()
+        self.assertEqual("dark", saved["theme"])
+        self.assertEqual(20, saved["compress_threshold"])
+        self.assertFalse(saved["auto_multiline"])
+
+    @mock.patch.object(config_module, "SAVE_DELAY", 0.05)
+    def test_unchanged_value_is_not_written(self):
+        self.config.set("theme", self.config.theme)
+
+        self.assertIsNone(self.config._save_timer)
+        self.config.flush()
+        self.assertEqual(0, self.writes)
+
+    def test_flush_writes_pending_changes_immediately(self):
+        self.config.set("theme", "dark")
+        timer = self.config._save_timer
+
+        self.config.flush()
+
+        # Written without waiting for SAVE_DELAY, and the timer cancelled
+        self.assertEqual(1, self.writes)
+        self.assertEqual("dark", self.read_file()["theme"])
+        self.assertIsNone(self.config._save_timer)
+        timer.join(5)
+        self.assertEqual(1, self.writes)
+
+    def test_flush_without_changes_does_not_write(self):
+        self.config.flush()
+
+        self.assertEqual(0, self.writes)
+
+    def test_pending_changes_survive_reload_after_flush(self):
+        self.config.set("theme", "dark")
+        self.config.set("history_max_entries", 50)
+        self.config.flush()
+
+        reloaded = ConfigManager(config_file=self.path)
+
+        self.assertEqual("dark", reloaded.theme)
+        self.assertEqual(50, reloaded.history_max_entries)
+
+    def test_flush_waits_for_save_in_flight(self):
+        started = threading.Event()
+        release = threading.Event()
+        save = self.config._save
+
+        def slow_save():
+            started.set()
+            release.wait(5)
+            save()
+
+        self.config._save = slow_save
+        self.config.set("theme", "dark")
+        saver = threading.Thread(target=self.config.flush)
+        saver.start()
+        started.wait(5)
+
+        # A second flush (as from atexit) must not return before the write
+        waiter = threading.Thread(target=self.config.flush)
+        waiter.start()
+        waiter.join(0.1)
+        self.assertTrue(waiter.is_alive())
+
+        release.set()
+        waiter.join(5)
+        saver.join(5)
+        self.assertEqual("dark", self.read_file()["theme"])
+
+    def test_failed_save_keeps_old_file(self):
+        self.config.set("theme", "dark")
+        self.config.flush()
+
+        self.config.set("theme", "light")
+        with mock.patch.object(config_module.os, "replace", side_effect=OSError):
+            self.config.flush()
+
+        self.assertEqual("dark", self.read_file()["theme"])
+        self.assertEqual(["test.config.json"], os.listdir(self.tmpdir))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+"""
+Unit Tests: History File Persistence
+
+Covers the background writer, compaction of the history file and loading
+large files from their tail.
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# Add scripts directory to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from data import history as history_module
+from data.history import HistoryManager
+
+
+class HistoryTestCase(unittest.TestCase):
+    """Base class giving each test its own history file."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "test.history")
+        self.managers = []
+
+    def tearDown(self):
+        for manager in self.managers:
+            manager.flush()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def make(self, max_entries: int = 1000) -> HistoryManager:
+        manager = HistoryManager(history_file=self.path, max_entries=max_entries)
+        self.managers.append(manager)
+        return manager
+
+    def read_lines(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            return f.read().splitlines()
+
+
+class TestRoundTrip(HistoryTestCase):
+    """Entries written by one manager are loaded by the next."""
+
+    def test_save_and_reload(self):
+        entries = [
+            "ls -la",
+            "line one\nline two",
+            "C:\\Users\\test\\file.py",
+            "literal \\n is not a newline",
+            "trailing backslash \\",
+            "中文 entry",
+        ]
+        history = self.make()
+        for entry in entries:
+            history.add(entry)
+        history.flush()
+
+        self.assertEqual(entries, self.make().entries)
+
+    def test_reload_keeps_newest_max_entries(self):
+        history = self.make()
+        for i in range(30):
+            history.add(f"cmd {i}")
+        history.flush()
+
+        reloaded = self.make(max_entries=10)
+
+        self.assertEqual([f"cmd {i}" for i in range(20, 30)], reloaded.entries)
+
+
+class TestCompaction(HistoryTestCase):
+    """The file is rewritten once it outgrows max_entries plus the slack."""
+
+    @mock.patch.object(history_module, "COMPACT_SLACK", 5)
+    def test_compacts_at_max_entries_plus_slack(self):
+        history = self.make(max_entries=10)
+        for i in range(15):
+            history.add(f"cmd {i}")
+        history.flush()
+
+        # Up to max_entries + slack lines the file is only appended to
+        self.assertEqual([f"cmd {i}" for i in range(15)], self.read_lines())
+
+        history.add("cmd 15")
+        history.flush()
+
+        self.assertEqual([f"cmd {i}" for i in range(6, 16)], self.read_lines())
+        self.assertEqual(history.entries, self.make(max_entries=10).entries)
+
+    @mock.patch.object(history_module, "COMPACT_SLACK", 5)
+    def test_compaction_counts_lines_already_in_file(self):
+        history = self.make()
+        for i in range(14):
+            history.add(f"cmd {i}")
+        history.flush()
+
+        # A fresh manager resumes from the 14 lines on disk
+        history = self.make(max_entries=10)
+        history.add("cmd 14")
+        history.flush()
+        self.assertEqual(15, len(self.read_lines()))
+
+        history.add("cmd 15")
+        history.flush()
+        self.assertEqual([f"cmd {i}" for i in range(6, 16)], self.read_lines())
+
+
+class TestTailLoad(HistoryTestCase):
+    """Files above TAIL_READ_THRESHOLD are loaded from their end."""
+
+    def write_raw(self, lines):
+        with open(self.path, "w", encoding="utf-8", newline="\n") as f:
+            f.write("".join(line + "\n" for line in lines))
+
+    def load(self, max_entries: int):
+        return self.make(max_entries=max_entries).entries
+
+    def test_tail_load_matches_full_load(self):
+        entries = []
+        for i in range(60):
+            entry = f"cmd {i} " + "x" * (1 + i % 13)
+            if i % 3 == 0:
+                entry += "\nsecond line\\n"
+            if i % 5 == 0:
+                entry += " 中文"
+            entries.append(entry)
+        history = self.make()
+        for entry in entries:
+            history.add(entry)
+        history.flush()
+
+        expected = self.load(max_entries=25)
+        # Tiny blocks put block boundaries inside lines and escapes
+        for block in (1, 2, 7, 16, 64):
+            with mock.patch.object(history_module, "TAIL_READ_THRESHOLD", 0):
+                with mock.patch.object(history_module, "TAIL_READ_BLOCK", block):
+                    tail = self.load(max_entries=25)
+            self.assertEqual(expected, tail, f"block={block}")
+
+        self.assertEqual(entries[-25:], expected)
+
+    @mock.patch.object(history_module, "TAIL_READ_THRESHOLD", 0)
+    @mock.patch.object(history_module, "TAIL_READ_BLOCK", 8)
+    def test_tail_load_skips_blank_lines(self):
+        lines = []
+        for i in range(20):
+            lines.append(f"cmd {i}")
+            lines.append("   " if i % 2 else "")
+        self.write_raw(lines)
+
+        self.assertEqual([f"cmd {i}" for i in range(12, 20)], self.load(max_entries=8))
+
+    @mock.patch.object(history_module, "TAIL_READ_THRESHOLD", 0)
+    @mock.patch.object(history_module, "TAIL_READ_BLOCK", 8)
+    def test_tail_load_with_fewer_lines_than_max_entries(self):
+        self.write_raw(["a\\nb", "c\\\\d", "e"])
+
+        self.assertEqual(["a\nb", "c\\d", "e"], self.load(max_entries=10))
+
+    def test_large_file_loads_newest_entries(self):
+        lines = [f"{i:06d} " + "y" * 90 + "\\nz" for i in range(3000)]
+        self.write_raw(lines)
+        self.assertGreater(
+            os.path.getsize(self.path), history_module.TAIL_READ_THRESHOLD
+        )
+
+        history = self.make(max_entries=100)
+
+        self.assertEqual(
+            [f"{i:06d} " + "y" * 90 + "\nz" for i in range(2900, 3000)],
+            history.entries,
+        )
+        # Unread lines are estimated, so compaction still sees the full file
+        self.assertAlmostEqual(3000, history._file_lines, delta=150)
+
+
+class TestFlush(HistoryTestCase):
+    """flush() drains the writer queue before returning."""
+
+    def test_flush_writes_all_queued_entries(self):
+        history = self.make()
+        for i in range(50):
+            history.add(f"cmd {i}")
+
+        history.flush()
+
+        self.assertIsNone(history._writer)
+        self.assertTrue(history._write_queue.empty())
+        self.assertEqual([f"cmd {i}" for i in range(50)], self.read_lines())
+
+    def test_add_after_flush_restarts_writer(self):
+        history = self.make()
+        history.add("first")
+        history.flush()
+
+        history.add("second")
+        self.assertIsNotNone(history._writer)
+        history.flush()
+
+        self.assertEqual(["first", "second"], self.read_lines())
+
+    def test_flush_without_writes_is_noop(self):
+        history = self.make()
+
+        history.flush()
+
+        self.assertIsNone(history._writer)
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
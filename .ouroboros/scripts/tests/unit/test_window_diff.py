@@ -0,0 +1,134 @@
+"""
+Unit Tests: ANSI Window Diff Rendering
+
+In ANSI mode a window refresh only sends the cells that changed since the
+last frame drawn on each terminal row.
+"""
+
+import sys
+import os
+import io
+import unittest
+from unittest import mock
+
+# Add scripts directory to path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from tui.screen import ScreenManager
+
+HIDE_AND_SAVE = "\x1b[?25l\x1b[s"
+RESTORE_AND_SHOW = "\x1b[u\x1b[?25h"
+
+
+class TestWindowDiff(unittest.TestCase):
+    """Window._render_ansi against the rows ScreenManager remembers."""
+
+    def setUp(self):
+        # Never entered, so windows are plain ANSI buffers
+        self.screen = ScreenManager(use_alt_screen=False)
+
+    def render(self, window) -> str:
+        """Refresh window and return what it wrote to the terminal."""
+        window._dirty = True
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as stream:
+            window.refresh()
+        return stream.getvalue()
+
+    def make(self, lines, width: int = 10, y: int = 2, x: int = 4):
+        window = self.screen.create_window(len(lines), width, y, x)
+        for row, text in enumerate(lines):
+            window.write(row, 0, text)
+        return window
+
+    def test_first_render_paints_every_row(self):
+        output = self.render(self.make(["hello", "world"]))
+
+        self.assertTrue(output.startswith(HIDE_AND_SAVE))
+        self.assertTrue(output.endswith(RESTORE_AND_SHOW))
+        self.assertIn("\x1b[3;5Hhello     ", output)
+        self.assertIn("\x1b[4;5Hworld     ", output)
+
+    def test_unchanged_frame_writes_nothing(self):
+        self.render(self.make(["hello", "world"]))
+
+        # A new window with the same content at the same place, as after a
+        # full rebuild of the layout
+        self.assertEqual("", self.render(self.make(["hello", "world"])))
+
+    def test_only_changed_cells_are_sent(self):
+        window = self.make(["hello", "world"])
+        self.render(window)
+
+        window.write(1, 3, "d!")
+        output = self.render(window)
+
+        # Row 3 is skipped; row 4 is sent from the first changed column
+        self.assertEqual(
+            HIDE_AND_SAVE + "\x1b[4;8Hd!     " + RESTORE_AND_SHOW,
+            output,
+        )
+
+    def test_style_change_alone_is_sent(self):
+        window = self.make(["hello"])
+        self.render(window)
+
+        window.write(0, 1, "ell", "\x1b[1m")
+        output = self.render(window)
+
+        self.assertIn("\x1b[3;6H\x1b[1mell\x1b[0mo     ", output)
+
+    def test_change_on_wide_char_continuation_starts_at_lead_cell(self):
+        window = self.make(["a中b"])
+        self.render(window)
+
+        # Only the continuation cell of the wide character differs; output
+        # must still start on the wide character itself
+        window._styles[0][2] = "\x1b[1m"
+        output = self.render(window)
+
+        self.assertIn("\x1b[3;6H中", output)
+
+    def test_invalidate_rows_forces_full_repaint(self):
+        window = self.make(["hello", "world"])
+        self.render(window)
+
+        self.screen.invalidate_rows()
+        output = self.render(window)
+
+        self.assertIn("\x1b[3;5Hhello     ", output)
+        self.assertIn("\x1b[4;5Hworld     ", output)
+
+    def test_resize_forces_full_repaint(self):
+        window = self.make(["hello", "world"])
+        self.render(window)
+
+        window.resize(2, 12)
+        output = self.render(window)
+
+        self.assertIn("\x1b[3;5Hhello       ", output)
+        self.assertIn("\x1b[4;5Hworld       ", output)
+
+    def test_row_drawn_from_another_column_is_repainted(self):
+        self.render(self.make(["hello"], x=4))
+
+        output = self.render(self.make(["hello"], x=6))
+
+        self.assertIn("\x1b[3;7Hhello     ", output)
+
+    def test_other_window_rows_are_not_affected(self):
+        top = self.make(["top"], y=0)
+        bottom = self.make(["bottom"], y=5)
+        self.render(top)
+        self.render(bottom)
+
+        top.write(0, 0, "TOP")
+        output = self.render(top)
+
+        self.assertIn("\x1b[1;5HTOP", output)
+        self.assertNotIn("\x1b[6;", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
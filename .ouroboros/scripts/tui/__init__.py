@@ -18,6 +18,7 @@ _lazy_imports = {
     "strip_ansi": ".output",
     "write_output": ".output",
     "write_ui": ".output",
+    "batch_ui_writes": ".output",
     "has_ansi_codes": ".output",
     "validate_output_purity": ".output",
     "OutputFormatter": ".output",
@@ -58,11 +58,12 @@ _PasteDetector = None
 _read_clipboard = None
 _SlashCommandHandler = None
 _prepend_instruction = None
-_HistoryManager = None
+_get_history = None
 _create_file_marker = None
 _create_paste_marker = None
 _is_file_path = None
 _is_windows_path_pattern = None
+_split_file_paths = None
 
 
 def _lazy_import_components():
@@ -115,19 +116,19 @@ def _lazy_import_input():
 
 def _lazy_import_data():
     """Lazy import data handlers for fast startup."""
-    global _HistoryManager
-    if _HistoryManager is None:
+    global _get_history
+    if _get_history is None:
         try:
-            from data.history import HistoryManager as HM
+            from data.history import get_history as gh
         except ImportError:
-            from ..data.history import HistoryManager as HM
-        _HistoryManager = HM
-    return _HistoryManager
+            from ..data.history import get_history as gh
+        _get_history = gh
+    return _get_history
 
 
 def _lazy_import_utils():
     """Lazy import utilities for fast startup."""
-    global _create_file_marker, _create_paste_marker, _is_file_path, _is_windows_path_pattern
+    global _create_file_marker, _create_paste_marker, _is_file_path, _is_windows_path_pattern, _split_file_paths
     if _create_file_marker is None:
         try:
             from utils.badge import (
@@ -137,6 +138,7 @@ def _lazy_import_utils():
             from utils.filepath import (
                 is_file_path as ifp,
                 is_windows_path_pattern as iwpp,
+                split_file_paths as sfp,
             )
         except ImportError:
             from ..utils.badge import (
@@ -146,16 +148,19 @@ def _lazy_import_utils():
             from ..utils.filepath import (
                 is_file_path as ifp,
                 is_windows_path_pattern as iwpp,
+                split_file_paths as sfp,
             )
         _create_file_marker = cfm
         _create_paste_marker = cpm
         _is_file_path = ifp
         _is_windows_path_pattern = iwpp
+        _split_file_paths = sfp
     return (
         _create_file_marker,
         _create_paste_marker,
         _is_file_path,
         _is_windows_path_pattern,
+        _split_file_paths,
     )
 
 
@@ -173,6 +178,9 @@ MODE_SEARCH = "SEARCH"
 PASTE_LINE_THRESHOLD = 5
 PASTE_CHAR_THRESHOLD = 100
 
+# Keys that end a collected drag-and-drop path
+_PATH_END_KEYS = frozenset((" ", "\t", "\n", "\r"))
+
 # Resize debounce time (ms)
 RESIZE_DEBOUNCE_MS = 100
 
@@ -348,7 +356,7 @@ class TUIApp:
             SlashCommandHandler,
             _,
         ) = _lazy_import_input()
-        HistoryManager = _lazy_import_data()
+        get_history = _lazy_import_data()
 
         # Store read_clipboard reference for use in handlers
         _read_clipboard = read_clipboard
@@ -385,8 +393,9 @@ class TUIApp:
         # Slash command handler
         self.slash_handler = SlashCommandHandler()
 
-        # History
-        self.history = HistoryManager()
+        # History (shared, so repeated TUI sessions don't re-read the file)
+        self.history = get_history()
+        self.history.reset_position()
 
     def _cleanup_components(self) -> None:
         """Cleanup components on exit."""
@@ -407,6 +416,17 @@ class TUIApp:
         if not self.screen:
             return
 
+        if self.screen.is_curses:
+            self._render_frame(full_redraw)
+            return
+
+        # ANSI mode: each window refresh and cursor move writes and flushes
+        # stderr on its own, so send the whole frame in one write
+        with batch_ui_writes():
+            self._render_frame(full_redraw)
+
+    def _render_frame(self, full_redraw: bool) -> None:
+        """Draw every component; see _render."""
         cols, rows = self.screen.get_size()
 
         # Check minimum size
@@ -582,7 +602,7 @@ class TUIApp:
                 max_iterations = 100  # Safety limit
                 for _ in range(max_iterations):
                     # Collect pending content
-                    chunk = self.keybuffer.read_all_pending()
+                    chunk = self._read_paste_chunk()
                     if chunk:
                         paste_parts.append(chunk)
 
@@ -593,7 +613,7 @@ class TUIApp:
                     more_events = self.keybuffer.get_pending_event_count()
                     if more_events < PASTE_EVENT_THRESHOLD:
                         # No more bulk events - collect any remaining
-                        final_chunk = self.keybuffer.read_all_pending()
+                        final_chunk = self._read_paste_chunk()
                         if final_chunk:
                             paste_parts.append(final_chunk)
                         break
@@ -625,7 +645,7 @@ class TUIApp:
 
                     max_iterations = 100  # Safety limit
                     for _ in range(max_iterations):
-                        chunk = self.keybuffer.read_all_pending()
+                        chunk = self._read_paste_chunk()
                         if chunk:
                             paste_parts.append(chunk)
 
@@ -633,7 +653,7 @@ class TUIApp:
 
                         more_events = self.keybuffer.get_pending_event_count()
                         if more_events < PASTE_EVENT_THRESHOLD:
-                            final_chunk = self.keybuffer.read_all_pending()
+                            final_chunk = self._read_paste_chunk()
                             if final_chunk:
                                 paste_parts.append(final_chunk)
                             break
@@ -671,6 +691,14 @@ class TUIApp:
             if self.keybuffer.is_printable(key):
                 self._handle_printable(key)
 
+    def _read_paste_chunk(self) -> str:
+        """Drain pending paste input, preferring the batched reader in paste mode."""
+        if self.keybuffer.is_pasting:
+            chunk = self.keybuffer.getch_batch()
+            if chunk:
+                return chunk
+        return self.keybuffer.read_all_pending()
+
     def _handle_special_key(self, key: str) -> bool:
         """
         Handle special keys (Ctrl combinations, etc.).
@@ -861,6 +889,7 @@ class TUIApp:
             _,
             is_file_path,
             is_windows_path_pattern,
+            _,
         ) = _lazy_import_utils()
 
         # === Windows Path Collection Mode ===
@@ -870,7 +899,7 @@ class TUIApp:
         # On timeout/space, we check if it's a valid path and convert to badge.
 
         if self._collecting_path:
-            if key in (" ", "\t", "\n", "\r"):
+            if key in _PATH_END_KEYS:
                 # Path ended - process it
                 self._process_path_buffer()
                 # Insert the space/tab normally
@@ -906,9 +935,8 @@ class TUIApp:
                     self._render()
                     return
 
-        # Check for >>> submit marker
-        text = self.input_box.buffer.text
-        if text.endswith(">>") and key == ">":
+        # Check for >>> submit marker (the key test is the cheap one)
+        if key == ">" and self.input_box.buffer.ends_with(">>"):
             # Remove >>> and submit
             self.input_box.buffer.backspace()
             self.input_box.buffer.backspace()
@@ -966,7 +994,7 @@ class TUIApp:
             return
 
         # Lazy import utils
-        create_file_marker, _, is_file_path, _ = _lazy_import_utils()
+        create_file_marker, _, is_file_path, _, _ = _lazy_import_utils()
 
         # Get the prefix that was tracked when collection started
         prefix = getattr(self, "_path_prefix", "")
@@ -975,7 +1003,8 @@ class TUIApp:
         full_path = prefix + self._path_buffer
 
         # Check if it's a valid file path
-        if is_file_path(full_path.strip()):
+        # A dropped path was just collected, so it is worth one stat
+        if is_file_path(full_path.strip(), check_disk=True):
             # Calculate how many characters to remove from buffer
             # The full path (prefix + buffer) is already in the buffer
             chars_to_remove = len(prefix) + len(self._path_buffer)
@@ -986,15 +1015,12 @@ class TUIApp:
 
             # Verify we have enough characters to remove
             if col >= chars_to_remove:
-                # Remove the raw path text from buffer by deleting chars_to_remove characters
-                # We need to delete from the current position backwards
-                removed = 0
-                for _ in range(chars_to_remove):
-                    if self.input_box.buffer.backspace():
-                        removed += 1
-                    else:
-                        # Can't backspace anymore (at start of buffer)
-                        break
+                # Remove the raw path text before the cursor with one slice
+                # instead of a backspace (and a line copy) per character
+                buffer = self.input_box.buffer
+                start = col - chars_to_remove
+                buffer.lines[buffer.cursor_row] = line[:start] + line[col:]
+                buffer.cursor_col = start
 
                 # Insert as file marker badge
                 marker = create_file_marker(full_path.strip())
@@ -1084,7 +1110,7 @@ class TUIApp:
 
         # Fix split drive-letter pastes where the first letter was handled as a
         # separate key event (e.g. 'D' then ':\\path...' treated as paste).
-        if content.startswith(":\\") or content.startswith(":/"):
+        if content.startswith((":\\", ":/")):
             row = self.input_box.buffer.cursor_row
             col = self.input_box.buffer.cursor_col
             line = self.input_box.buffer.lines[row]
@@ -1097,7 +1123,13 @@ class TUIApp:
                     content = drive + content
 
         # Lazy import utils
-        create_file_marker, create_paste_marker, is_file_path, _ = _lazy_import_utils()
+        (
+            create_file_marker,
+            create_paste_marker,
+            is_file_path,
+            _,
+            split_file_paths,
+        ) = _lazy_import_utils()
 
         # Update mode
         self.mode = MODE_PASTE
@@ -1110,19 +1142,15 @@ class TUIApp:
             self.input_box.buffer.insert_text(marker)
         else:
             # Multiple file paths (one per line)
-            non_empty_lines = [
-                line.strip() for line in cleaned.split("\n") if line.strip()
-            ]
-            if len(non_empty_lines) > 1 and all(
-                is_file_path(line) for line in non_empty_lines
-            ):
+            non_empty_lines = split_file_paths(cleaned)
+            if non_empty_lines:
                 markers = "\n".join(
                     create_file_marker(line) for line in non_empty_lines
                 )
                 self.input_box.buffer.insert_text(markers)
             else:
                 # Large paste -> paste marker (badge). Otherwise insert raw text.
-                line_count = len(content.split("\n")) if content else 0
+                line_count = content.count("\n") + 1 if content else 0
                 if (
                     line_count >= PASTE_LINE_THRESHOLD
                     or len(content) >= PASTE_CHAR_THRESHOLD
@@ -1294,7 +1322,7 @@ class TUIApp:
 
 
 # Import format_output from output module
-from .output import format_output
+from .output import batch_ui_writes, format_output
 
 
 def run_tui(
@@ -9,7 +9,9 @@ the final content to stdout while keeping UI elements on stderr.
 
 import sys
 import re
-from typing import Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional, Tuple
 
 # Use try/except for import compatibility
 try:
@@ -41,6 +43,9 @@ def strip_ansi(text: str) -> str:
     Property 5: Output Content Purity
 
     """
+    # Plain text has nothing to strip; skip the regex scan
+    if "\x1b" not in text:
+        return text
     return ANSI_PATTERN.sub("", text)
 
 
@@ -117,6 +122,50 @@ def write_ui(text: str) -> None:
     sys.stderr.flush()
 
 
+class _StderrBatch:
+    """Stand-in for sys.stderr that collects writes instead of sending them."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self.parts = []
+
+    def write(self, text: str) -> int:
+        self.parts.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+@contextmanager
+def batch_ui_writes():
+    """
+    Send everything written to stderr inside the block as one write.
+
+    ANSI-mode windows and cursor moves each write and flush stderr, so a
+    single redraw costs several syscalls; inside this block they are
+    collected and flushed together on exit. Nested blocks join the
+    outermost one.
+    """
+    stream = sys.stderr
+    if isinstance(stream, _StderrBatch):
+        yield
+        return
+
+    batch = _StderrBatch(stream)
+    sys.stderr = batch
+    try:
+        yield
+    finally:
+        sys.stderr = stream
+        if batch.parts:
+            stream.write("".join(batch.parts))
+            stream.flush()
+
+
 def write_ui_line(text: str) -> None:
     """
     Write a line of UI text to stderr with newline.
@@ -273,8 +322,28 @@ THEME = {
 }
 
 
+# Colored side border, shared by every box line
+_BOX_SIDE = f"{THEME['border']}{BOX_CHARS['v']}{THEME['reset']}"
+
+
+@lru_cache(maxsize=32)
+def _box_borders(content_width: int) -> Tuple[str, str, str]:
+    """Return the colored (top, separator, bottom) lines for a box width."""
+    c = THEME
+    box = BOX_CHARS
+    sep = box["h"] * content_width
+    return (
+        f"{c['border']}{box['tl']}{sep}{box['tr']}{c['reset']}",
+        f"{c['border']}{box['lj']}{sep}{box['rj']}{c['reset']}",
+        f"{c['border']}{box['bl']}{sep}{box['br']}{c['reset']}",
+    )
+
+
 def _visible_len(text: str) -> int:
     """Get visible length of text (ignoring ANSI codes)."""
+    # Printable ASCII is one column per character
+    if text.isascii() and text.isprintable():
+        return len(text)
     clean = strip_ansi(text)
     # Handle CJK characters (2-column width)
     import unicodedata
@@ -331,7 +400,6 @@ class OutputBox:
         """
         cols, rows = _get_terminal_size()
         c = THEME
-        box = BOX_CHARS
 
         # Calculate width
         if full_width:
@@ -340,44 +408,48 @@ class OutputBox:
             width = min(cols - 4, 80)
 
         content_width = width - 2  # Inside borders
-        sep = box["h"] * content_width
+        top, sep, bottom = _box_borders(content_width)
 
         # Split content into lines
         lines = content.split("\n")
 
+        # The whole box is collected and written (and flushed) once
+        out = []
+
         # Header
-        write_ui_line(f"{c['border']}{box['tl']}{sep}{box['tr']}{c['reset']}")
+        out.append(top)
         header = f" {c['prompt']}[>] {marker.upper()}{c['reset']}"
         header_padded = _pad_text(header, content_width)
-        write_ui_line(
-            f"{c['border']}{box['v']}{c['reset']}{header_padded}{c['border']}{box['v']}{c['reset']}"
-        )
-        write_ui_line(f"{c['border']}{box['lj']}{sep}{box['rj']}{c['reset']}")
+        out.append(f"{_BOX_SIDE}{header_padded}{_BOX_SIDE}")
+        out.append(sep)
 
         # Content with side borders (handle CJK width)
         for line in lines:
             line_width = _visible_len(line)
             if line_width > content_width:
-                # Truncate accounting for display width
-                truncated = ""
+                # Truncate accounting for display width: find the cut point,
+                # then slice once instead of growing a string per character
+                import unicodedata
+
+                east_asian_width = unicodedata.east_asian_width
+                limit = content_width - 3
+                cut = 0
                 current_width = 0
                 for ch in line:
-                    import unicodedata
-
-                    ea = unicodedata.east_asian_width(ch)
+                    ea = east_asian_width(ch)
                     ch_width = 2 if ea in ("W", "F") or ord(ch) >= 0x1F300 else 1
-                    if current_width + ch_width > content_width - 3:
+                    if current_width + ch_width > limit:
                         break
-                    truncated += ch
                     current_width += ch_width
-                line = truncated + f"{c['dim']}...{c['reset']}"
+                    cut += 1
+                line = line[:cut] + f"{c['dim']}...{c['reset']}"
             padded_line = _pad_text(line, content_width)
-            write_ui_line(
-                f"{c['border']}{box['v']}{c['reset']}{padded_line}{c['border']}{box['v']}{c['reset']}"
-            )
+            out.append(f"{_BOX_SIDE}{padded_line}{_BOX_SIDE}")
 
         # Footer
-        write_ui_line(f"{c['border']}{box['bl']}{sep}{box['br']}{c['reset']}")
+        out.append(bottom)
+        out.append("")
+        write_ui("\n".join(out))
 
     @staticmethod
     def render_success(message: str = "Transmitted to Copilot") -> None:
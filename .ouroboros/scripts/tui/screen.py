@@ -66,9 +66,13 @@ class ScreenManager:
         self.colors_enabled = False
         self._cleanup_registered = False
         self._original_sigwinch = None
+        self._sigwinch_installed = False  # Resizes are signalled, not polled
         self._resize_pending = False
         self._last_size: Tuple[int, int] = (80, 24)
         self._windows = []
+        # ANSI mode: the cells last drawn on each terminal row, as
+        # row -> (x, chars, styles), so unchanged cells are not redrawn
+        self._ansi_rows = {}
 
     def __enter__(self) -> "ScreenManager":
         """Initialize curses and enter alternate screen buffer."""
@@ -124,11 +128,7 @@ class ScreenManager:
             pass  # Some terminals don't support cursor visibility
 
         # Set up resize handling
-        if not IS_WINDOWS:
-            # Unix: use SIGWINCH
-            self._original_sigwinch = signal.signal(
-                signal.SIGWINCH, self._handle_sigwinch
-            )
+        self._install_sigwinch()
 
         # Get initial size
         self._last_size = self.get_size()
@@ -139,8 +139,21 @@ class ScreenManager:
             sys.stderr.write(self.ENTER_ALT_SCREEN)
             sys.stderr.flush()
 
-        # Get terminal size
+        # Get terminal size, then rely on SIGWINCH instead of re-querying it
         self._last_size = self._get_terminal_size()
+        self._install_sigwinch()
+
+    def _install_sigwinch(self) -> None:
+        """Unix: watch SIGWINCH so the terminal size only changes on resize."""
+        if IS_WINDOWS or self._sigwinch_installed:
+            return
+        try:
+            self._original_sigwinch = signal.signal(
+                signal.SIGWINCH, self._handle_sigwinch
+            )
+            self._sigwinch_installed = True
+        except (ValueError, OSError):
+            pass  # Not the main thread; fall back to polling
 
     def _cleanup(self) -> None:
         """Restore terminal state."""
@@ -174,6 +187,7 @@ class ScreenManager:
                 signal.signal(signal.SIGWINCH, self._original_sigwinch)
             except Exception:
                 pass
+        self._sigwinch_installed = False
 
     def _handle_sigwinch(self, signum, frame) -> None:
         """Handle SIGWINCH (window resize) signal on Unix."""
@@ -218,6 +232,9 @@ class ScreenManager:
         """Get current terminal size (cols, rows)."""
         if self.use_curses and self.stdscr is not None:
             return (curses.COLS, curses.LINES)
+        # With SIGWINCH watched, the size is unchanged until a resize arrives
+        if self._sigwinch_installed and not self._resize_pending:
+            return self._last_size
         return self._get_terminal_size()
 
     def check_resize(self) -> bool:
@@ -230,6 +247,10 @@ class ScreenManager:
         if self._resize_pending:
             return True
 
+        # SIGWINCH sets _resize_pending, so there is nothing to poll
+        if self._sigwinch_installed:
+            return False
+
         current_size = self._get_terminal_size()
         if current_size != self._last_size:
             self._resize_pending = True
@@ -273,6 +294,16 @@ class ScreenManager:
             # ANSI clear screen
             sys.stderr.write("\x1b[2J\x1b[H")
             sys.stderr.flush()
+            self.invalidate_rows()
+
+    def invalidate_rows(self) -> None:
+        """
+        Forget what ANSI mode last drew on each row.
+
+        Call after writing to the terminal other than through a Window, so
+        the next refresh repaints every row instead of only changed cells.
+        """
+        self._ansi_rows.clear()
 
     def show_cursor(self) -> None:
         """Show the cursor."""
@@ -297,24 +297,47 @@ class Window:
         Note: We don't use CLEAR_LINE (\x1b[2K) because it clears the entire
         terminal line, not just our window area. Instead, we overwrite with
         spaces which is handled by the buffer content.
+
+        Only changed cells are sent: the screen manager remembers what was
+        last drawn on each terminal row, so a row this window drew last
+        frame is skipped if unchanged, or redrawn from its first changed
+        cell to the end. A row last drawn from another column is repainted
+        in full.
         """
+        drawn = self.parent._ansi_rows
         output = []
 
-        # Hide cursor and save position
-        output.append("\x1b[?25l")
-        output.append("\x1b[s")  # Save cursor
-
         for row in range(self._height):
             # Move to row position (1-based)
             terminal_row = self._y + row + 1
-            terminal_col = self._x + 1
+            chars = self._buffer[row]
+            styles = self._styles[row]
+
+            start = 0
+            previous = drawn.get(terminal_row)
+            if previous is not None and previous[0] == self._x:
+                _, old_chars, old_styles = previous
+                if old_chars == chars and old_styles == styles:
+                    continue
+                if len(old_chars) == len(chars):
+                    while (
+                        chars[start] == old_chars[start]
+                        and styles[start] == old_styles[start]
+                    ):
+                        start += 1
+                    # Never start on the second column of a wide character
+                    if start > 0 and chars[start] == "":
+                        start -= 1
+            drawn[terminal_row] = (self._x, list(chars), list(styles))
+
+            terminal_col = self._x + start + 1
             output.append(f"\x1b[{terminal_row};{terminal_col}H")
 
             # Build line content (buffer already contains spaces for empty areas)
             current_style = ""
-            for col in range(self._width):
-                style = self._styles[row][col]
-                char = self._buffer[row][col]
+            for col in range(start, self._width):
+                style = styles[col]
+                char = chars[col]
 
                 # Handle style change
                 if style != current_style:
@@ -330,7 +353,11 @@ class Window:
             if current_style:
                 output.append("\x1b[0m")
 
-        # Restore cursor position and show cursor
+        if not output:
+            return
+
+        # Hide cursor and save position; restore and show it afterwards
+        output.insert(0, "\x1b[?25l\x1b[s")
         output.append("\x1b[u")  # Restore cursor
         output.append("\x1b[?25h")  # Show cursor
 
@@ -37,6 +37,7 @@ _lazy_imports = {
     "get_filename": ".filepath",
     "detect_windows_path_start": ".filepath",
     "is_windows_path_pattern": ".filepath",
+    "split_file_paths": ".filepath",
     "FILE_EXTENSIONS": ".filepath",
     "ALL_EXTENSIONS": ".filepath",
 }
@@ -18,7 +18,6 @@ from typing import Tuple, Optional
 
 from .filepath import get_filename
 
-
 # =============================================================================
 # MARKER CONSTANTS
 # =============================================================================
@@ -34,6 +33,14 @@ PASTE_MARKER_END = "‹/PASTE›"
 # Newline encoding in paste markers
 NEWLINE_ENCODED = "⏎"
 
+# Compiled once; these run on every render and submit
+_FILE_MARKER_RE = re.compile(
+    rf"{re.escape(FILE_MARKER_START)}([^{re.escape(FILE_MARKER_END)}]+){re.escape(FILE_MARKER_END)}"
+)
+_PASTE_MARKER_RE = re.compile(r"‹PASTE:(\d+)›(.*?)‹/PASTE›", re.DOTALL)
+# Whole-string parse keeps the greedy body of the original pattern
+_PASTE_PARSE_RE = re.compile(r"‹PASTE:(\d+)›(.*)‹/PASTE›", re.DOTALL)
+
 
 # =============================================================================
 # FILE PATH MARKERS
@@ -117,8 +124,7 @@ def create_paste_marker(content: str) -> str:
 
 
     """
-    lines = content.split("\n")
-    line_count = len(lines)
+    line_count = content.count("\n") + 1
 
     # Encode newlines so marker stays on one line
     encoded = content.replace("\n", NEWLINE_ENCODED)
@@ -149,7 +155,7 @@ def parse_paste_marker(text: str) -> Tuple[int, str]:
     Returns:
         Tuple of (line_count, decoded_content) or (0, text) if not a marker
     """
-    match = re.match(r"‹PASTE:(\d+)›(.*)‹/PASTE›", text, re.DOTALL)
+    match = _PASTE_PARSE_RE.match(text)
     if match:
         line_count = int(match.group(1))
         # Decode newlines (⏎ back to \n)
@@ -177,6 +183,11 @@ def extract_paste_content(marker: str) -> str:
 # =============================================================================
 
 
+def _decode_paste(match: re.Match) -> str:
+    """Replacement for one _PASTE_MARKER_RE match: the decoded content."""
+    return match.group(2).replace(NEWLINE_ENCODED, "\n")
+
+
 def expand_markers(text: str) -> str:
     """
     Expand all markers in text to their original content.
@@ -197,22 +208,17 @@ def expand_markers(text: str) -> str:
 
 
     """
-    result = text
-
-    # Expand file path markers: «path» -> path
-    result = re.sub(
-        rf"{re.escape(FILE_MARKER_START)}([^{re.escape(FILE_MARKER_END)}]+){re.escape(FILE_MARKER_END)}",
-        r"\1",
-        result,
-    )
+    # File markers are expanded first, across the whole text, so a paste
+    # marker inside a stray «...» span is still decoded by the second pass.
+    # Plain text (the common case) never enters the regex engine.
+    if FILE_MARKER_START in text:
+        text = _FILE_MARKER_RE.sub(r"\1", text)
 
-    # Expand paste markers: ‹PASTE:N›content‹/PASTE› -> content (with decoded newlines)
-    def decode_paste(match: re.Match) -> str:
-        return match.group(1).replace(NEWLINE_ENCODED, "\n")
+    if PASTE_MARKER_START in text:
+        # Paste marker: ‹PASTE:N›content‹/PASTE› -> content (decoded newlines)
+        text = _PASTE_MARKER_RE.sub(_decode_paste, text)
 
-    result = re.sub(r"‹PASTE:\d+›(.*?)‹/PASTE›", decode_paste, result, flags=re.DOTALL)
-
-    return result
+    return text
 
 
 # =============================================================================
@@ -236,39 +242,29 @@ def render_for_display(text: str) -> str:
 
 
     """
-    result = text
 
-    # Convert file markers to badges
     def file_to_badge(match: re.Match) -> str:
-        path = match.group(1)
-        filename = get_filename(path)
-        return f"[ {filename} ]"
-
-    result = re.sub(
-        rf"{re.escape(FILE_MARKER_START)}([^{re.escape(FILE_MARKER_END)}]+){re.escape(FILE_MARKER_END)}",
-        file_to_badge,
-        result,
-    )
+        return f"[ {get_filename(match.group(1))} ]"
 
-    # Convert paste markers to badges
     def paste_to_badge(match: re.Match) -> str:
         line_count = int(match.group(1))
-        content = match.group(2)
-
         if line_count == 1:
             # For single line, show character count
-            char_count = len(content.replace(NEWLINE_ENCODED, ""))
+            content = match.group(2)
+            char_count = len(content) - content.count(NEWLINE_ENCODED)
             if char_count > 50:
                 return f"[ Pasted 1 Line ({char_count} chars) ]"
             return "[ Pasted 1 Line ]"
 
         return f"[ Pasted {line_count} Lines ]"
 
-    result = re.sub(
-        r"‹PASTE:(\d+)›(.*?)‹/PASTE›", paste_to_badge, result, flags=re.DOTALL
-    )
-
-    return result
+    # File markers first, then paste markers, each skipped when its opening
+    # literal is absent
+    if FILE_MARKER_START in text:
+        text = _FILE_MARKER_RE.sub(file_to_badge, text)
+    if PASTE_MARKER_START in text:
+        text = _PASTE_MARKER_RE.sub(paste_to_badge, text)
+    return text
 
 
 def format_file_badge(path: str) -> str:
@@ -324,16 +320,14 @@ def find_markers(text: str) -> list[Tuple[int, int, str]]:
     """
     markers = []
 
-    # Find file markers
-    for match in re.finditer(
-        rf"{re.escape(FILE_MARKER_START)}[^{re.escape(FILE_MARKER_END)}]+{re.escape(FILE_MARKER_END)}",
-        text,
-    ):
-        markers.append((match.start(), match.end(), "file"))
+    # Skip each scan when its opening literal is absent
+    if FILE_MARKER_START in text:
+        for match in _FILE_MARKER_RE.finditer(text):
+            markers.append((match.start(), match.end(), "file"))
 
-    # Find paste markers
-    for match in re.finditer(r"‹PASTE:\d+›.*?‹/PASTE›", text, re.DOTALL):
-        markers.append((match.start(), match.end(), "paste"))
+    if PASTE_MARKER_START in text:
+        for match in _PASTE_MARKER_RE.finditer(text):
+            markers.append((match.start(), match.end(), "paste"))
 
     # Sort by position
     markers.sort(key=lambda x: x[0])
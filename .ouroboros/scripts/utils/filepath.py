@@ -9,7 +9,9 @@ Windows and Unix paths, including relative paths and known file extensions.
 
 import os
 import re
-from typing import Optional, Set
+import time
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 # =============================================================================
 # FILE EXTENSION CATEGORIES
@@ -118,17 +120,73 @@ FILE_EXTENSIONS: dict[str, Set[str]] = {
 }
 
 # Flatten all extensions for quick lookup
-ALL_EXTENSIONS: Set[str] = set()
-for exts in FILE_EXTENSIONS.values():
-    ALL_EXTENSIONS.update(exts)
+ALL_EXTENSIONS: FrozenSet[str] = frozenset(
+    ext for exts in FILE_EXTENSIONS.values() for ext in exts
+)
+
+# Extension -> category; the first category listing an extension wins
+_EXT_TO_CATEGORY: Dict[str, str] = {}
+for _category, _exts in FILE_EXTENSIONS.items():
+    for _ext in _exts:
+        _EXT_TO_CATEGORY.setdefault(_ext, _category)
+del _category, _exts, _ext
 
 
 # =============================================================================
 # PATH DETECTION FUNCTIONS
 # =============================================================================
 
-
-def is_file_path(text: str) -> bool:
+# Path prefixes, tried in order:
+# - win:  C:\path or D:/path (case-insensitive drive letter)
+# - unc:  \\server\share
+# - unix: /path/to/file
+# - home: ~/path
+# - rel:  ./file, ../file, .\file, ..\file
+_PATH_PREFIX_RE = re.compile(
+    r"(?P<win>[^\W\d_]:[\\/])"
+    r"|(?P<unc>\\\\)"
+    r"|(?P<unix>/)"
+    r"|(?P<home>~)"
+    r"|(?P<rel>\.\.?[\\/])"
+)
+
+# Longest text treated as a path (PATH_MAX on Linux); longer pastes are
+# rejected before any parsing
+MAX_PATH_LENGTH = 4096
+
+# Text worth probing on disk: one token without shell/glob metacharacters
+_PATH_SHAPED_RE = re.compile(rf'[^\s<>|*?"]{{1,{MAX_PATH_LENGTH}}}')
+
+# Recent os.stat results (None when the path is missing); the drag-and-drop
+# collector re-checks the same path as it grows, so a short TTL keeps stats
+# off repeated checks. One stat answers existence, type and size together.
+STAT_CACHE_TTL = 2.0
+STAT_CACHE_SIZE = 256
+_stat_cache: Dict[str, Tuple[float, Optional[os.stat_result]]] = {}
+
+
+def _stat_cached(path: str) -> Optional[os.stat_result]:
+    """os.stat with a short-lived cache of recent answers, None if missing."""
+    now = time.monotonic()
+    cached = _stat_cache.get(path)
+    if cached is not None and now - cached[0] < STAT_CACHE_TTL:
+        return cached[1]
+    if len(_stat_cache) >= STAT_CACHE_SIZE:
+        _stat_cache.clear()
+    try:
+        st: Optional[os.stat_result] = os.stat(path)
+    except (OSError, ValueError):
+        st = None
+    _stat_cache[path] = (now, st)
+    return st
+
+
+def _path_exists(path: str) -> bool:
+    """os.path.exists backed by the stat cache."""
+    return _stat_cached(path) is not None
+
+
+def is_file_path(text: str, check_disk: bool = False) -> bool:
     """
     Check if the given text looks like a file or folder path.
 
@@ -140,6 +198,8 @@ def is_file_path(text: str) -> bool:
 
     Args:
         text: The text to check
+        check_disk: Also accept path-shaped text that exists on disk;
+            off by default so detection on input paths costs no syscalls
 
     Returns:
         True if text appears to be a file path
@@ -148,58 +208,62 @@ def is_file_path(text: str) -> bool:
     """
     text = text.strip().strip('"').strip("'")
 
-    if not text:
+    if not text or len(text) > MAX_PATH_LENGTH:
         return False
 
-    # Windows absolute path: C:\path or D:/path (case-insensitive drive letter)
-    if (
-        len(text) >= 3
-        and text[0].isalpha()
-        and text[1] == ":"
-        and text[2] in ("\\", "/")
-    ):
-        return _validate_windows_path(text)
-
-    # Windows UNC path: \\server\share
-    if text.startswith("\\\\"):
+    # One anchored match classifies the path prefix
+    match = _PATH_PREFIX_RE.match(text)
+    if match:
+        kind = match.lastgroup
+        if kind == "win":
+            return _validate_windows_path(text, check_disk)
+        if kind == "unix":
+            return _validate_unix_path(text, check_disk)
+        # UNC (\\server\share), home (~/path) and relative (./, ..\) paths
         return True
 
-    # Unix absolute path: /path/to/file
-    if text.startswith("/"):
-        return _validate_unix_path(text)
-
-    # Home directory: ~/path
-    if text.startswith("~"):
+    # One extension lookup covers both a known extension and any extension
+    # on text that contains a path separator
+    ext = get_file_extension(text)
+    if ext and (ext in ALL_EXTENSIONS or "/" in text or "\\" in text):
         return True
 
-    # Relative path: ./file or ../file
-    if text.startswith("./") or text.startswith("../"):
-        return True
-    if text.startswith(".\\") or text.startswith("..\\"):
+    # Check if path exists on disk, only for text shaped like a single path
+    if check_disk and _PATH_SHAPED_RE.fullmatch(text) and _path_exists(text):
         return True
 
-    # Check for known file extension
-    ext = get_file_extension(text)
-    if ext in ALL_EXTENSIONS:
-        return True
+    return False
 
-    # Check if path contains separators and has an extension
-    if ("/" in text or "\\" in text) and "." in text:
-        ext = get_file_extension(text)
-        if ext:
-            return True
 
-    # Check if path exists on disk
-    if os.path.exists(text):
-        return True
+def split_file_paths(text: str) -> Optional[List[str]]:
+    """
+    Split text into file paths, one per non-empty line.
 
-    return False
+    Stops at the first line that is not a path, so ordinary multi-line
+    pastes are rejected after checking a single line.
 
+    Args:
+        text: The text to split
 
-def _validate_windows_path(text: str) -> bool:
+    Returns:
+        The stripped paths if there are two or more and every non-empty
+        line is a path, otherwise None
+    """
+    paths = []
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        if not is_file_path(line):
+            return None
+        paths.append(line)
+    return paths if len(paths) > 1 else None
+
+
+def _validate_windows_path(text: str, check_disk: bool = False) -> bool:
     """Validate a Windows absolute path."""
     # If path exists, it's valid
-    if os.path.exists(text):
+    if check_disk and _path_exists(text):
         return True
 
     # Check for known extension
@@ -208,24 +272,24 @@ def _validate_windows_path(text: str) -> bool:
         return True
 
     # Path ends with separator - definitely a folder
-    if text.endswith("\\") or text.endswith("/"):
+    if text.endswith(("\\", "/")):
         return True
 
     # Has multiple path components - likely valid
-    if text.count("\\") >= 1 or text.count("/") >= 1:
+    if "\\" in text or "/" in text:
         return True
 
     return False
 
 
-def _validate_unix_path(text: str) -> bool:
+def _validate_unix_path(text: str, check_disk: bool = False) -> bool:
     """Validate a Unix absolute path."""
     # Exclude slash commands (they start with /ouroboros)
     if text.startswith("/ouroboros"):
         return False
 
     # If path exists, it's valid
-    if os.path.exists(text):
+    if check_disk and _path_exists(text):
         return True
 
     # Must have at least one more path component
@@ -240,6 +304,7 @@ def _validate_unix_path(text: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=4096)
 def get_file_extension(path: str) -> str:
     """
     Get lowercase file extension from path.
@@ -255,6 +320,7 @@ def get_file_extension(path: str) -> str:
     return ""
 
 
+@lru_cache(maxsize=4096)
 def get_file_category(path: str) -> str:
     """
     Get the category of a file based on its extension.
@@ -265,11 +331,7 @@ def get_file_category(path: str) -> str:
     Returns:
         Category name ('code', 'config', 'doc', etc.) or 'file'
     """
-    ext = get_file_extension(path)
-    for category, extensions in FILE_EXTENSIONS.items():
-        if ext in extensions:
-            return category
-    return "file"
+    return _EXT_TO_CATEGORY.get(get_file_extension(path), "file")
 
 
 def get_filename(path: str) -> str:
@@ -288,9 +350,10 @@ def get_filename(path: str) -> str:
     filename = os.path.basename(path)
 
     if not filename:
-        # Maybe it's a directory, use the last component
-        parts = path.replace("\\", "/").rstrip("/").split("/")
-        filename = parts[-1] if parts else path
+        # Maybe it's a directory, use the last component; slicing after the
+        # last separator avoids rebuilding and splitting the whole path
+        trimmed = path.rstrip("/\\")
+        filename = trimmed[max(trimmed.rfind("/"), trimmed.rfind("\\")) + 1 :]
 
     return filename
 
@@ -371,8 +434,7 @@ def process_pasted_content(content: str, multiline_threshold: int = 5) -> tuple:
     from .badge import create_file_marker, create_paste_marker, format_paste_badge
 
     content = content.strip()
-    lines = content.split("\n")
-    line_count = len(lines)
+    line_count = content.count("\n") + 1
 
     # Check if it's a single file path (not multi-line)
     if "\n" not in content and is_file_path(content):
@@ -382,8 +444,8 @@ def process_pasted_content(content: str, multiline_threshold: int = 5) -> tuple:
         return (display, marker, True, "file")
 
     # Check for multiple file paths (one per line)
-    non_empty_lines = [line.strip() for line in lines if line.strip()]
-    if len(non_empty_lines) > 1 and all(is_file_path(line) for line in non_empty_lines):
+    non_empty_lines = split_file_paths(content)
+    if non_empty_lines:
         # Multiple files - create markers for each
         markers = []
         displays = []
@@ -78,6 +78,10 @@ def visible_len(text: str) -> int:
     if not text:
         return 0
 
+    # Printable ASCII is one column per character
+    if text.isascii() and text.isprintable():
+        return len(text)
+
     # First strip ANSI codes
     clean_text = strip_ansi(text)
 
@@ -101,6 +105,10 @@ def strip_ansi(text: str) -> str:
     if not text:
         return ""
 
+    # Plain text has nothing to strip; skip the regex scan
+    if "\x1b" not in text:
+        return text
+
     return ANSI_PATTERN.sub("", text)
 
 